@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class OrganizationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "organization"
+
+    def ready(self):
+        from .services.rollups import connect_rollup_signals
+
+        connect_rollup_signals()
@@ -0,0 +1,65 @@
+# organization/conditional.py
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .services.rollups import get_rollup_version
+from .services.tree import get_tree_version
+
+
+def make_etag(*parts):
+    """
+    Returns a strong ETag over the given parts, which must have stable reprs.
+    """
+
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def organization_validators(request, updated_at, *parts):
+    """
+    Returns the ``(etag, last_modified)`` of an organization response.
+
+    Both fold in the shared tree and rollup versions, so deletes, re-parents
+    and counter changes revalidate even when no ``updated_at`` moved.
+
+    Args:
+        request (HttpRequest): The request; its path and query are part of the ETag.
+        updated_at (datetime | None): The latest ``updated_at`` in the response.
+        *parts: Anything else the response body depends on.
+
+    Returns:
+        tuple: The quoted ETag and the last-modified time as a Unix timestamp.
+    """
+
+    tree_version = get_tree_version()
+    rollup_version = get_rollup_version()
+    last_modified = max(tree_version, rollup_version) // 1000
+    if updated_at is not None:
+        last_modified = max(last_modified, int(updated_at.timestamp()))
+    etag = make_etag(
+        request.get_full_path(),
+        request.headers.get("Accept", ""),
+        updated_at.isoformat() if updated_at else None,
+        tree_version,
+        rollup_version,
+        *parts,
+    )
+    return etag, last_modified
+
+
+def not_modified(request, etag, last_modified):
+    """
+    Returns a 304 (or 412) response when the request's preconditions allow
+    it, else None.
+    """
+
+    return get_conditional_response(request, etag=etag, last_modified=last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    return response
@@ -0,0 +1,42 @@
+# organization/conf.py
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def hierarchy_index_enabled():
+    """
+    Whether the OrganizationClosure index is maintained and used for subtree
+    lookups. Deployments that have not migrated the index table yet can set
+    ``ORGANIZATION_HIERARCHY_INDEX = False`` to fall back to recursive queries.
+    """
+
+    return getattr(settings, "ORGANIZATION_HIERARCHY_INDEX", True)
+
+
+def rollup_counters_enabled():
+    """
+    Whether the cached faction/facility/attendee counters on Organization are
+    maintained incrementally. Set ``ORGANIZATION_ROLLUP_COUNTERS = False`` to
+    skip the extra UPDATEs and repair later with ``recompute_rollups``.
+    """
+
+    return getattr(settings, "ORGANIZATION_ROLLUP_COUNTERS", True)
+
+
+def search_backend(using=None):
+    """
+    Which index organization search runs on: ``"trigram"`` (pg_trgm GIN
+    indexes, PostgreSQL with ``django.contrib.postgres`` installed) or
+    ``"terms"`` (the portable OrganizationSearchTerm prefix table). Set
+    ``ORGANIZATION_SEARCH_BACKEND`` to force one.
+    """
+
+    backend = getattr(settings, "ORGANIZATION_SEARCH_BACKEND", None)
+    if backend:
+        return backend
+    vendor = connections[using or DEFAULT_DB_ALIAS].vendor
+    if vendor == "postgresql" and apps.is_installed("django.contrib.postgres"):
+        return "trigram"
+    return "terms"
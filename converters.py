@@ -0,0 +1,15 @@
+# organization/converters.py
+
+
+class OrganizationPathConverter:
+    """
+    Matches a slug path from a root organization, e.g. ``council/district/unit``.
+    """
+
+    regex = r"[-a-zA-Z0-9_]+(?:/[-a-zA-Z0-9_]+)*"
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
@@ -1,7 +1,35 @@
 # organization/forms/organization.py
 
 from django import forms
-from ..models.organization import Organization, OrganizationLabels
+from django.urls import reverse_lazy
+
+from ..models.organization import DEFAULT_LABELS, Organization, OrganizationLabels
+
+
+class OrganizationAutocompleteSelect(forms.Select):
+    """
+    Select that only renders the selected organization, labelled with its
+    path; other organizations are fetched from the autocomplete endpoint as
+    the user types, so the page never embeds the whole table.
+    """
+
+    class Media:
+        js = ('organization/js/autocomplete.js',)
+
+    def __init__(self, attrs=None):
+        super().__init__(attrs)
+        self.attrs.setdefault(
+            'data-autocomplete-url', reverse_lazy('organization_autocomplete')
+        )
+
+    def optgroups(self, name, value, attrs=None):
+        from ..services.autocomplete import path_label
+
+        self.choices = [('', '---------')] + [
+            (pk, path_label(int(pk)) or pk) for pk in value if pk and pk.isdigit()
+        ]
+        return super().optgroups(name, value, attrs)
+
 
 class OrganizationForm(forms.ModelForm):
     class Meta:
@@ -20,7 +48,7 @@ class OrganizationForm(forms.ModelForm):
             'description': forms.Textarea(attrs={'class': 'form-control'}),
             'abbreviation': forms.TextInput(attrs={'class': 'form-control'}),
             'max_depth': forms.NumberInput(attrs={'class': 'form-control'}),
-            'parent': forms.Select(attrs={'class': 'form-control'}),
+            'parent': OrganizationAutocompleteSelect(attrs={'class': 'form-control'}),
         }
 
     def clean(self):
@@ -30,26 +58,32 @@ class OrganizationForm(forms.ModelForm):
 
 
 class OrganizationLabelsForm(forms.ModelForm):
+    """
+    Edits an organization's labels. Every label is shown with its effective
+    value over the value inherited from the parent; blank or inherited values
+    are stored as no override.
+    """
+
     class Meta:
         model = OrganizationLabels
-        fields = [
-            'attendee_label',
-            'facility_label',
-            'faction_label',
-            'sub_faction_label',
-            'faculty_label',
-            'leader_label',
-            'faculty_quarters_label',
-            'faction_quarters_label',
-            'leader_quarters_label',
-            'attendee_quarters_label',
-            'course_label',
-            'facility_enrollment_label',
-            'faction_enrollment_label',
-            'leader_enrollment_label',
-            'attendee_enrollment_label',
-            'attendee_class_enrollment_label',
-            'week_label',
-            'period_label',
-        ]
-        
+        fields = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.inherited = self.instance.inherited_labels()
+        for key in DEFAULT_LABELS:
+            self.fields[key] = forms.CharField(
+                max_length=50,
+                required=False,
+                initial=self.instance.overrides.get(key, self.inherited[key]),
+                widget=forms.TextInput(attrs={'placeholder': self.inherited[key]}),
+            )
+
+    def save(self, commit=True):
+        overrides = {}
+        for key in DEFAULT_LABELS:
+            value = self.cleaned_data.get(key)
+            if value and value != self.inherited[key]:
+                overrides[key] = value
+        self.instance.overrides = overrides
+        return super().save(commit)
@@ -0,0 +1,101 @@
+# organization/management/commands/benchmark_hierarchy.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from ...conf import hierarchy_index_enabled, search_backend
+from ...models.organization import Organization
+
+
+class RollbackBenchmark(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures query counts and timings of subtree queries and ranked "
+        "search over synthetic organization trees. All generated rows are "
+        "rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            nargs="+",
+            type=int,
+            default=[10, 100, 1000, 10000],
+            help="Tree sizes (number of organizations) to benchmark.",
+        )
+        parser.add_argument(
+            "--branching",
+            type=int,
+            default=10,
+            help="Number of children per organization in the synthetic tree.",
+        )
+        parser.add_argument(
+            "--search",
+            default="organization 12",
+            help="Query to time against the search index.",
+        )
+
+    def handle(self, *args, **options):
+        backend = "closure index" if hierarchy_index_enabled() else "recursive CTE"
+        self.stdout.write(
+            f"Backend: {backend}, {search_backend()} search ({connection.vendor})"
+        )
+        self.stdout.write(
+            f"{'orgs':>8} {'queries':>8} {'ms':>10} {'search ms':>10} {'hits':>8}"
+        )
+        query = options["search"]
+        for size in options["sizes"]:
+            try:
+                with transaction.atomic():
+                    self._build_tree(size, options["branching"])
+                    queries, elapsed = self._measure(
+                        lambda: list(Organization.objects.all().with_all_factions())
+                    )
+                    # A typeahead page: the 20 best matches.
+                    hits = []
+                    _, search_elapsed = self._measure(
+                        lambda: hits.extend(Organization.objects.search(query)[:20])
+                    )
+                    self.stdout.write(
+                        f"{size:>8} {queries:>8} {elapsed:>10.2f} "
+                        f"{search_elapsed:>10.2f} {len(hits):>8}"
+                    )
+                    raise RollbackBenchmark
+            except RollbackBenchmark:
+                pass
+
+    def _build_tree(self, size, branching):
+        created = []
+        level = [None]
+        while len(created) < size:
+            next_level = []
+            for parent in level:
+                batch = [
+                    Organization(
+                        name=f"Benchmark Organization {len(created) + offset}",
+                        slug=f"benchmark-organization-{len(created) + offset}",
+                        parent=parent,
+                        max_depth=size,
+                    )
+                    for offset in range(min(branching, size - len(created)))
+                ]
+                created.extend(batch)
+                next_level.extend(batch)
+                if len(created) >= size:
+                    break
+            level = next_level
+        # Parents are inserted level by level, along with the hierarchy index.
+        Organization.objects.bulk_create(created)
+
+    def _measure(self, func):
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            func()
+            elapsed = (time.perf_counter() - started) * 1000
+        return len(context.captured_queries), elapsed
@@ -0,0 +1,65 @@
+# organization/management/commands/export_organizations.py
+
+from django.core.management.base import BaseCommand, CommandError, OutputWrapper
+
+from ...models.organization import Organization
+from ...selectors import resolve_organization_id
+from ...services import tree
+from ...services.exporter import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    export_queryset,
+    export_rows,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams organizations, with their effective labels, address and rollup "
+        "counts, to CSV or JSON Lines in hierarchy order."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--organization",
+            help=(
+                "Only export this organization and its subtree, by slug or by "
+                'slug path from the root ("council/district").'
+            ),
+        )
+        parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="csv")
+        parser.add_argument(
+            "--output", default="-", help='File to write, or "-" for stdout.'
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help="Rows fetched from the database per round trip.",
+        )
+
+    def handle(self, *args, **options):
+        root = None
+        slug = options["organization"]
+        if slug:
+            organization_id = resolve_organization_id(slug)
+            if organization_id is None:
+                if len(tree.get_tree().slugs.get(slug, ())) > 1:
+                    raise CommandError(
+                        f'Organization "{slug}" is ambiguous; give its slug path '
+                        "from the root instead."
+                    )
+                raise CommandError(f'Organization "{slug}" does not exist.')
+            root = Organization.objects.get(pk=organization_id)
+
+        stream, _ = EXPORT_FORMATS[options["format"]]
+        rows = export_rows(export_queryset(root), chunk_size=options["chunk_size"])
+        if options["output"] == "-":
+            self._write(stream(rows), self.stdout)
+        else:
+            with open(options["output"], "w", newline="", encoding="utf-8") as output:
+                self._write(stream(rows), OutputWrapper(output))
+
+    def _write(self, lines, output):
+        for line in lines:
+            output.write(line, ending="")
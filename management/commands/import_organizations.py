@@ -0,0 +1,57 @@
+# organization/management/commands/import_organizations.py
+
+import sys
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from ...services.importer import IMPORT_CHUNK_SIZE, import_organizations, read_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports an organization tree from a CSV or JSON Lines file. Rows name "
+        "their parent by slug; the whole file is imported in one transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='File to import, or "-" for stdin.')
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="Input format. Defaults to the file extension, else csv.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=IMPORT_CHUNK_SIZE,
+            help="Organizations inserted per batch.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or ("jsonl" if path.endswith(".jsonl") else "csv")
+        started = time.perf_counter()
+        try:
+            if path == "-":
+                created = self._import(sys.stdin, format, options["chunk_size"])
+            else:
+                with open(path, newline="", encoding="utf-8") as stream:
+                    created = self._import(stream, format, options["chunk_size"])
+        except OSError as error:
+            raise CommandError(error)
+        except (ValidationError, ValueError) as error:
+            raise CommandError("; ".join(getattr(error, "messages", [str(error)])))
+        elapsed = time.perf_counter() - started
+
+        rate = created / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {created} organizations in {elapsed:.2f}s "
+                f"({rate:.0f} rows/s)."
+            )
+        )
+
+    def _import(self, stream, format, chunk_size):
+        return import_organizations(read_rows(stream, format), chunk_size=chunk_size)
@@ -0,0 +1,25 @@
+# organization/management/commands/rebuild_hierarchy.py
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ...conf import hierarchy_index_enabled
+from ...services.hierarchy import rebuild_hierarchy_index, rebuild_paths
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes every organization's stored path and depth, and the "
+        "hierarchy index, from the parent column."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            moved = rebuild_paths()
+            links = rebuild_hierarchy_index() if hierarchy_index_enabled() else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Repositioned {moved} organizations and wrote {links} hierarchy "
+                "index rows."
+            )
+        )
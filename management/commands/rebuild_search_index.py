@@ -0,0 +1,24 @@
+# organization/management/commands/rebuild_search_index.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...conf import search_backend
+from ...services.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the portable organization search index from names, "
+        "abbreviations and descriptions."
+    )
+
+    def handle(self, *args, **options):
+        if search_backend() != "terms":
+            raise CommandError(
+                "Organization search uses trigram indexes on this database; "
+                "there is no term index to rebuild."
+            )
+        indexed = rebuild_search_index()
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {indexed} organizations for search.")
+        )
@@ -0,0 +1,42 @@
+# organization/management/commands/recompute_rollups.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models.organization import Organization
+from ...selectors import resolve_organization_id
+from ...services import tree
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the cached faction, facility and attendee counters on "
+        "organizations from the source tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--organization",
+            help=(
+                "Only recompute this organization and its subtree, by slug or by "
+                'slug path from the root ("council/district").'
+            ),
+        )
+
+    def handle(self, *args, **options):
+        organizations = Organization.objects.all()
+        slug = options["organization"]
+        if slug:
+            organization_id = resolve_organization_id(slug)
+            if organization_id is None:
+                if len(tree.get_tree().slugs.get(slug, ())) > 1:
+                    raise CommandError(
+                        f'Organization "{slug}" is ambiguous; give its slug path '
+                        "from the root instead."
+                    )
+                raise CommandError(f'Organization "{slug}" does not exist.')
+            organizations = organizations.filter(pk=organization_id).with_descendants()
+
+        updated = organizations.recompute_rollups()
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed rollups for {updated} organizations.")
+        )
@@ -4,6 +4,7 @@ from django.db import models
 
 from ..querysets.organization import OrganizationQuerySet, OrganizationLabelsQuerySet
 
+
 class OrganizationManager(models.Manager):
     """
     A custom manager for the Organization model.
@@ -87,6 +88,19 @@ class OrganizationManager(models.Manager):
         """
         return self.get_queryset().active()
 
+    def search(self, query, within=None):
+        """
+        Returns organizations matching the given text, best match first.
+
+        Args:
+            query (str): The text to search for in names, abbreviations and descriptions.
+            within (Organization | int | None): Only search this subtree.
+
+        Returns:
+            QuerySet: A QuerySet of matching organizations annotated with ``search_rank``.
+        """
+        return self.get_queryset().search(query, within=within)
+
     def search_by_name(self, name):
         """
         Returns a QuerySet containing organizations that match the given name.
@@ -111,9 +125,63 @@ class OrganizationManager(models.Manager):
         """
         return self.get_queryset().children_of(parent_id)
 
+    def descendants_of(self, organization, include_self=True):
+        """
+        Returns a QuerySet containing the organizations in the subtree of the specified organization.
+
+        Args:
+            organization (Organization | int): The subtree root or its id.
+            include_self (bool): Whether to include the subtree root itself.
+
+        Returns:
+            QuerySet: A QuerySet containing the organizations in the subtree.
+        """
+        return self.get_queryset().descendants_of(organization, include_self)
+
+    def ancestors_of(self, organization, include_self=True):
+        """
+        Returns a QuerySet containing the ancestors of the specified organization.
+
+        Args:
+            organization (Organization | int): The organization or its id.
+            include_self (bool): Whether to include the organization itself.
+
+        Returns:
+            QuerySet: A QuerySet containing the organization's ancestors.
+        """
+        return self.get_queryset().ancestors_of(organization, include_self)
+
+    def with_subtree_counts(self, *args, **kwargs):
+        """
+        Returns a QuerySet annotated with subtree-inclusive faction, facility and attendee counts.
+
+        Returns:
+            QuerySet: A QuerySet with ``total_<relation>_count`` annotations.
+        """
+        return self.get_queryset().with_subtree_counts(*args, **kwargs)
+
     def with_total_factions_count(self):
+        """
+        Returns a QuerySet annotated with ``total_factions_count`` for each organization's subtree.
+
+        Returns:
+            QuerySet: A QuerySet with a ``total_factions_count`` annotation.
+        """
         return self.get_queryset().with_total_factions_count()
 
+
 class OrganizationLabelsManager(models.Manager):
     def get_queryset(self):
-        return OrganizationLabelsQuerySet(self.model, using=self._db)
\ No newline at end of file
+        return OrganizationLabelsQuerySet(self.model, using=self._db)
+
+    def for_organizations(self, organization_ids):
+        """
+        Returns the effective, inherited labels of many organizations.
+
+        Args:
+            organization_ids (Iterable[int]): The organizations to resolve.
+
+        Returns:
+            dict: Label bundles keyed by organization id.
+        """
+        return self.get_queryset().for_organizations(organization_ids)
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_hierarchy_index(apps, schema_editor):
+    Organization = apps.get_model("organization", "Organization")
+    OrganizationClosure = apps.get_model("organization", "OrganizationClosure")
+    db_alias = schema_editor.connection.alias
+
+    parents = dict(
+        Organization.objects.using(db_alias).values_list("pk", "parent_id")
+    )
+    links = []
+    for organization_id in parents:
+        depth = 0
+        current = organization_id
+        seen = set()
+        while current is not None and current not in seen:
+            seen.add(current)
+            links.append(
+                OrganizationClosure(
+                    ancestor_id=current, descendant_id=organization_id, depth=depth
+                )
+            )
+            current = parents.get(current)
+            depth += 1
+    OrganizationClosure.objects.using(db_alias).bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organization", "0008_organization_address"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrganizationClosure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("depth", models.PositiveIntegerField(default=0)),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="descendant_links",
+                        to="organization.organization",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="ancestor_links",
+                        to="organization.organization",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("ancestor", "descendant"),
+                        name="unique_org_closure_link",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(build_hierarchy_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.2.8 on 2026-10-18 10:03
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+ROLLUP_RELATIONS = ("factions", "facilities", "attendees")
+
+
+def _count(rows):
+    totals = (
+        rows.order_by()
+        .annotate(total=models.Func(models.F("pk"), function="COUNT"))
+        .values("total")
+    )
+    return Coalesce(models.Subquery(totals, output_field=models.IntegerField()), 0)
+
+
+def fill_rollup_counters(apps, schema_editor):
+    Organization = apps.get_model("organization", "Organization")
+    OrganizationClosure = apps.get_model("organization", "OrganizationClosure")
+    db_alias = schema_editor.connection.alias
+
+    relations = {
+        related.related_name: related for related in Organization._meta.related_objects
+    }
+    subtree = OrganizationClosure.objects.filter(
+        ancestor_id=models.OuterRef(models.OuterRef("pk"))
+    ).values("descendant_id")
+    updates = {}
+    for relation in ROLLUP_RELATIONS:
+        related = relations.get(relation)
+        if related is None:
+            # The related app is not migrated yet, so it has no rows to count.
+            continue
+        rows = related.related_model._base_manager.using(db_alias)
+        attname = related.field.attname
+        updates[f"{relation}_count"] = _count(
+            rows.filter(**{attname: models.OuterRef("pk")})
+        )
+        updates[f"subtree_{relation}_count"] = _count(
+            rows.filter(**{f"{attname}__in": subtree})
+        )
+    if updates:
+        Organization.objects.using(db_alias).update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organization", "0009_organizationclosure"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="attendees_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="facilities_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="factions_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="subtree_attendees_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="subtree_facilities_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="subtree_factions_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_rollup_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.8 on 2026-10-18 11:27
+
+from django.db import migrations, models
+
+
+def build_paths(apps, schema_editor):
+    Organization = apps.get_model("organization", "Organization")
+    db_alias = schema_editor.connection.alias
+
+    parents = dict(
+        Organization.objects.using(db_alias).values_list("pk", "parent_id")
+    )
+    organizations = []
+    for organization_id, parent_id in parents.items():
+        ancestors = []
+        current = parent_id
+        while current is not None and current not in ancestors:
+            ancestors.append(current)
+            current = parents.get(current)
+        organizations.append(
+            Organization(
+                pk=organization_id,
+                path="".join(f"{ancestor}/" for ancestor in reversed(ancestors)),
+                depth=len(ancestors),
+            )
+        )
+    Organization.objects.using(db_alias).bulk_update(
+        organizations, ["path", "depth"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organization", "0010_organization_rollup_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="depth",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="organization",
+            name="path",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=255
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organization",
+            index=models.Index(
+                fields=["path"], name="org_path_idx", opclasses=["varchar_pattern_ops"]
+            ),
+        ),
+        migrations.RunPython(build_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:02
+
+from django.db import migrations, models
+
+LABEL_DEFAULTS = {
+    "attendee_label": "Attendee",
+    "facility_label": "Facility",
+    "faction_label": "Faction",
+    "sub_faction_label": "Sub-Faction",
+    "faculty_label": "Faculty",
+    "leader_label": "Leader",
+    "quarters_label": "Quarters",
+    "faculty_quarters_label": "Faculty Quarters",
+    "faction_quarters_label": "Faction Quarters",
+    "leader_quarters_label": "Leader Quarters",
+    "attendee_quarters_label": "Attendee Quarters",
+    "course_label": "Course",
+    "facility_enrollment_label": "Facility Enrollment",
+    "faction_enrollment_label": "Faction Enrollment",
+    "leader_enrollment_label": "Leader Enrollment",
+    "attendee_enrollment_label": "Attendee Enrollment",
+    "attendee_class_enrollment_label": "Attendee Class Enrollment",
+    "week_label": "Week",
+    "period_label": "Period",
+    "department_label": "Department",
+}
+
+
+def copy_overrides(apps, schema_editor):
+    OrganizationLabels = apps.get_model("organization", "OrganizationLabels")
+    db_alias = schema_editor.connection.alias
+
+    changed = []
+    for labels in OrganizationLabels.objects.using(db_alias).iterator():
+        overrides = {
+            key: getattr(labels, key)
+            for key, default in LABEL_DEFAULTS.items()
+            if getattr(labels, key) and getattr(labels, key) != default
+        }
+        if overrides:
+            labels.overrides = overrides
+            changed.append(labels)
+    OrganizationLabels.objects.using(db_alias).bulk_update(
+        changed, ["overrides"], batch_size=1000
+    )
+
+
+def restore_columns(apps, schema_editor):
+    OrganizationLabels = apps.get_model("organization", "OrganizationLabels")
+    db_alias = schema_editor.connection.alias
+
+    changed = []
+    for labels in OrganizationLabels.objects.using(db_alias).exclude(overrides={}):
+        for key in LABEL_DEFAULTS:
+            if labels.overrides.get(key):
+                setattr(labels, key, labels.overrides[key][:50])
+        changed.append(labels)
+    OrganizationLabels.objects.using(db_alias).bulk_update(
+        changed, list(LABEL_DEFAULTS), batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organization", "0011_organization_depth_path"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organizationlabels",
+            name="overrides",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.RunPython(copy_overrides, restore_columns),
+    ] + [
+        migrations.RemoveField(model_name="organizationlabels", name=key)
+        for key in LABEL_DEFAULTS
+    ]
@@ -0,0 +1,118 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:05
+
+import re
+import unicodedata
+
+import django.db.models.deletion
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.db import migrations, models
+
+# Frozen copies of the term rules of services.search at the time of this
+# migration, so later changes there do not alter the backfill.
+SEARCH_FIELD_WEIGHTS = {"name": 4, "abbreviation": 3, "description": 1}
+PREFIX_FIELDS = ("name", "abbreviation")
+MIN_PREFIX_LENGTH = 2
+SEARCH_TERM_LENGTH = 20
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_words(text):
+    if not text:
+        return []
+    text = str(text)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return [word[:SEARCH_TERM_LENGTH] for word in _WORD.findall(text.casefold())]
+
+
+def organization_terms(name, abbreviation, description):
+    terms = {}
+    for field, text in zip(SEARCH_FIELD_WEIGHTS, (name, abbreviation, description)):
+        weight = SEARCH_FIELD_WEIGHTS[field]
+        for word in normalize_words(text):
+            shortest = MIN_PREFIX_LENGTH if field in PREFIX_FIELDS else len(word)
+            for length in range(min(shortest, len(word)), len(word) + 1):
+                term = word[:length]
+                term_weight = weight * 2 if length == len(word) else weight
+                if terms.get(term, 0) < term_weight:
+                    terms[term] = term_weight
+    return terms
+
+
+def uses_search_terms(connection):
+    # The term table is only maintained by the "terms" search backend, the
+    # default everywhere but PostgreSQL with django.contrib.postgres.
+    backend = getattr(settings, "ORGANIZATION_SEARCH_BACKEND", None)
+    if backend:
+        return backend == "terms"
+    return not (
+        connection.vendor == "postgresql"
+        and global_apps.is_installed("django.contrib.postgres")
+    )
+
+
+def fill_search_terms(apps, schema_editor):
+    if not uses_search_terms(schema_editor.connection):
+        return
+    Organization = apps.get_model("organization", "Organization")
+    OrganizationSearchTerm = apps.get_model("organization", "OrganizationSearchTerm")
+    db_alias = schema_editor.connection.alias
+    organizations = Organization.objects.using(db_alias).only(
+        "name", "abbreviation", "description"
+    )
+    OrganizationSearchTerm.objects.using(db_alias).bulk_create(
+        (
+            OrganizationSearchTerm(
+                organization_id=organization.pk, term=term, weight=weight
+            )
+            for organization in organizations.iterator()
+            for term, weight in organization_terms(
+                organization.name, organization.abbreviation, organization.description
+            ).items()
+        ),
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organization", "0013_organization_name_id_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrganizationSearchTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=20)),
+                ("weight", models.PositiveSmallIntegerField(default=1)),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_terms",
+                        to="organization.organization",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="organizationsearchterm",
+            constraint=models.UniqueConstraint(
+                fields=("term", "organization"), name="unique_org_search_term"
+            ),
+        ),
+        migrations.RunPython(fill_search_terms, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.8 on 2026-10-18 18:05
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+try:
+    from django.contrib.postgres.operations import TrigramExtension
+except ImportError:
+    # No PostgreSQL driver installed, so no database these indexes apply to.
+    TrigramExtension = None
+
+
+class AddPostgreSQLIndex(migrations.AddIndex):
+    """
+    Adds an index to the model state on every database, but only creates it
+    on PostgreSQL; other backends search the OrganizationSearchTerm table.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organization", "0014_organizationsearchterm"),
+    ]
+
+    operations = [
+        *([TrigramExtension()] if TrigramExtension else []),
+        AddPostgreSQLIndex(
+            model_name="organization",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"], name="org_name_trgm_idx", opclasses=["gin_trgm_ops"]
+            ),
+        ),
+        AddPostgreSQLIndex(
+            model_name="organization",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["abbreviation"],
+                name="org_abbreviation_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        AddPostgreSQLIndex(
+            model_name="organization",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["description"],
+                name="org_description_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -1,3 +1,13 @@
-from .organization import Organization, OrganizationLabels
+from .organization import (
+    Organization,
+    OrganizationClosure,
+    OrganizationLabels,
+    OrganizationSearchTerm,
+)
 
-__all__ = ["Organization", "OrganizationLabels"]
+__all__ = [
+    "Organization",
+    "OrganizationClosure",
+    "OrganizationLabels",
+    "OrganizationSearchTerm",
+]
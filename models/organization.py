@@ -1,17 +1,69 @@
 # organization/models/organization.py
 
-from django.db.models.signals import post_save, pre_save
+from types import MappingProxyType
+
+from django.contrib.postgres.indexes import GinIndex
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, router, transaction
 from django.urls import reverse
 from django.utils import timezone
 
 from core.mixins import models as mixins
 from core.mixins import settings as stgs
 
+from ..conf import hierarchy_index_enabled, search_backend
 from ..managers.organization import OrganizationManager, OrganizationLabelsManager
 
+_UNKNOWN_PARENT = object()
+
+ROLLUP_COUNTER_FIELDS = (
+    "factions_count",
+    "facilities_count",
+    "attendees_count",
+    "subtree_factions_count",
+    "subtree_facilities_count",
+    "subtree_attendees_count",
+)
+POSITION_FIELDS = ("path", "depth")
+# Text indexed for search; see services.search.
+SEARCH_FIELDS = ("name", "abbreviation", "description")
+
+# Shared, read-only label defaults. Organizations only store the labels they
+# override; adding a label type here needs no migration.
+DEFAULT_LABELS = MappingProxyType(
+    {
+        "attendee_label": "Attendee",
+        "facility_label": "Facility",
+        "faction_label": "Faction",
+        "sub_faction_label": "Sub-Faction",
+        "faculty_label": "Faculty",
+        "leader_label": "Leader",
+        "quarters_label": "Quarters",
+        "faculty_quarters_label": "Faculty Quarters",
+        "faction_quarters_label": "Faction Quarters",
+        "leader_quarters_label": "Leader Quarters",
+        "attendee_quarters_label": "Attendee Quarters",
+        "course_label": "Course",
+        "facility_enrollment_label": "Facility Enrollment",
+        "faction_enrollment_label": "Faction Enrollment",
+        "leader_enrollment_label": "Leader Enrollment",
+        "attendee_enrollment_label": "Attendee Enrollment",
+        "attendee_class_enrollment_label": "Attendee Class Enrollment",
+        "week_label": "Week",
+        "period_label": "Period",
+        "department_label": "Department",
+    }
+)
+
+
+def writes_parent(update_fields):
+    """Whether a save with these ``update_fields`` writes the parent."""
+    return update_fields is None or not {"parent", "parent_id"}.isdisjoint(
+        update_fields
+    )
+
 
 class Organization(
     mixins.HierarchicalEntity, mixins.AddressableMixin, stgs.SettingsMixin, models.Model
@@ -20,25 +72,175 @@ class Organization(
 
     abbreviation = models.CharField(max_length=25, null=True, blank=True)
     max_depth = models.PositiveIntegerField(default=0, blank=True)
+    # Number of ancestors, and their ids from the root down to the parent
+    # ("1/5/"). Kept in sync on save; see services.hierarchy.
+    depth = models.PositiveIntegerField(default=0, editable=False)
+    path = models.CharField(max_length=255, default="", blank=True, editable=False)
+
+    # Cached rollups, kept current by services.rollups and repaired with the
+    # recompute_rollups management command.
+    factions_count = models.PositiveIntegerField(default=0, editable=False)
+    facilities_count = models.PositiveIntegerField(default=0, editable=False)
+    attendees_count = models.PositiveIntegerField(default=0, editable=False)
+    subtree_factions_count = models.PositiveIntegerField(default=0, editable=False)
+    subtree_facilities_count = models.PositiveIntegerField(default=0, editable=False)
+    subtree_attendees_count = models.PositiveIntegerField(default=0, editable=False)
 
     objects = OrganizationManager()
 
     def __str__(self):
         return f"{self.name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the parent as loaded so re-parenting can be detected on save
+        # without another query.
+        instance._loaded_parent_id = instance.__dict__.get("parent_id", _UNKNOWN_PARENT)
+        # Likewise the searchable text, so unchanged text is not reindexed.
+        instance._loaded_search_text = instance.search_text(default=_UNKNOWN_PARENT)
+        return instance
+
+    def search_text(self, default=None):
+        """The values of ``SEARCH_FIELDS``, with ``default`` for deferred ones."""
+        return tuple(self.__dict__.get(field, default) for field in SEARCH_FIELDS)
+
+    @property
+    def tree_path(self):
+        """The materialized path of this organization's own subtree."""
+        return f"{self.path}{self.pk}/"
+
     def clean(self):
-        # Check for depth
-        depth = 0
-        current = self
-        while current.parent is not None:
-            depth += 1
-            if depth > self.max_depth:
-                raise ValidationError("Maximum hierarchy depth exceeded")
-            current = current.parent
+        if not self.parent_id:
+            return
+        from ..services.hierarchy import position_under_parent
+
+        # The parent's stored path holds every ancestor; one query at most.
+        path, depth = position_under_parent(self)
+        if self.pk is not None and str(self.pk) in path.split("/"):
+            raise ValidationError(
+                "An organization cannot be placed under itself or its descendants."
+            )
+        if depth > self.max_depth:
+            raise ValidationError("Maximum hierarchy depth exceeded")
+
+    def get_parent_ancestor_ids(self):
+        """
+        Returns the ids of the parent organization and all of its ancestors.
+
+        Returns:
+            list: A list of integer ids, root first, empty for a root organization.
+        """
+
+        from ..services.hierarchy import position_under_parent
+
+        path, _ = position_under_parent(self)
+        return [int(pk) for pk in path.split("/") if pk]
 
     def save(self, *args, **kwargs):
+        from ..services import hierarchy
+        from ..services.labels import invalidate_organization_labels
+
+        using = kwargs.get("using") or router.db_for_write(Organization, instance=self)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = kwargs["update_fields"] = list(update_fields)
+        previous = None
+        if not self._state.adding and writes_parent(update_fields):
+            previous = hierarchy.previous_position(self, using=using)
+        if self._state.adding or previous is not None:
+            self.path, self.depth = hierarchy.position_under_parent(self, using=using)
         self.clean()
-        super().save(*args, **kwargs)
+        if previous is not None:
+            hierarchy.validate_subtree_depth(self, previous, using=using)
+
+        if not self._state.adding and update_fields is None:
+            # Counters and descendant positions are maintained with in-place
+            # UPDATEs; never write back the possibly stale values loaded with
+            # this instance.
+            skipped = ROLLUP_COUNTER_FIELDS
+            if previous is None:
+                skipped += POSITION_FIELDS
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.name not in skipped
+                and field.attname not in deferred
+            ]
+        elif update_fields is not None and previous is not None:
+            kwargs["update_fields"] = {*update_fields, *POSITION_FIELDS}
+
+        # The hierarchy index is maintained from post_save; keep all writes atomic.
+        try:
+            with transaction.atomic(using=using):
+                super().save(*args, **kwargs)
+                if previous is not None:
+                    hierarchy.rewrite_subtree_paths(self, previous, using=using)
+                    # The subtree now inherits labels from different ancestors.
+                    invalidate_organization_labels(self.pk, using=using)
+        finally:
+            self._parent_position = None
+
+    def delete(self, *args, **kwargs):
+        from ..services.rollups import tracking_deletes
+
+        with tracking_deletes():
+            return super().delete(*args, **kwargs)
+
+    def move_subtree(self, new_parent):
+        """
+        Moves this organization, with its whole subtree, under a new parent.
+
+        Cycles and ``max_depth`` for every node in the subtree are validated
+        before anything is written; the move itself runs a constant number of
+        statements in one transaction, regardless of subtree size.
+
+        Args:
+            new_parent (Organization | None): The new parent, or None to make a root.
+
+        Raises:
+            ValidationError: If the move would create a cycle or exceed max_depth.
+        """
+
+        parent_field = self._meta.get_field("parent")
+        previous_parent_id = self.parent_id
+        previous_parent = parent_field.get_cached_value(self, None)
+        previous_position = (self.path, self.depth)
+        self.parent = new_parent
+        try:
+            self.save()
+        except ValidationError:
+            if previous_parent is not None or previous_parent_id is None:
+                self.parent = previous_parent
+            else:
+                # Assigning the id drops the cached rejected parent.
+                self.parent_id = previous_parent_id
+            self.path, self.depth = previous_position
+            raise
+
+    def get_subtree(self):
+        """
+        Returns a QuerySet containing the current organization and all its descendants.
+
+        Uses the hierarchy index when it is enabled and a recursive query otherwise.
+        """
+
+        if hierarchy_index_enabled():
+            return Organization.objects.descendants_of(self)
+        return Organization.objects.filter(pk=self.pk).with_descendants()
+
+    def get_ancestry(self):
+        """
+        Returns a QuerySet containing the current organization and all its ancestors.
+
+        Uses the hierarchy index when it is enabled and a recursive query otherwise.
+        """
+
+        if hierarchy_index_enabled():
+            return Organization.objects.ancestors_of(self)
+        return Organization.objects.filter(pk=self.pk).with_ancestors()
 
     def get_total_factions_count(self):
         """
@@ -48,10 +250,7 @@ class Organization(
             int: The total count of factions for the current organization and all its children.
         """
 
-        total_count = self.factions.count()
-        for child_org in self.children.all():
-            total_count += child_org.get_total_factions_count()
-        return total_count
+        return self.get_subtree().aggregate(total=models.Count("factions"))["total"]
 
     def get_descendant_ids(self):
         """
@@ -61,10 +260,14 @@ class Organization(
             list: A list of integer ids representing the current object and all its descendants.
         """
 
-        descendant_ids = [self.id]
-        for child in self.children.all():
-            descendant_ids.extend(child.get_descendant_ids())
-        return descendant_ids
+        if hierarchy_index_enabled():
+            return list(
+                OrganizationClosure.objects.filter(ancestor_id=self.pk)
+                .order_by("depth", "descendant_id")
+                .values_list("descendant_id", flat=True)
+            )
+        descendant_ids = self.get_subtree().values_list("pk", flat=True)
+        return [self.pk] + sorted(pk for pk in descendant_ids if pk != self.pk)
 
     def get_active_factions(self):
         """
@@ -76,20 +279,36 @@ class Organization(
         return self.factions.filter(is_active=True)
 
     def get_root_organization(self):
-        if self.parent:
-            return self.parent.get_root_organization()
-        return self
+        if not self.parent_id:
+            return self
+        from ..services.tree import root_of
+
+        root_id = root_of(self.pk)
+        if root_id is not None and root_id != self.pk:
+            root = Organization.objects.filter(pk=root_id).first()
+            if root is not None:
+                return root
+        return self.get_ancestry().top_level().first()
 
     def get_fallback_chain(self):
         """
         Generate a fallback chain for settings, starting with the current object
         and traversing up to parent organizations.
         """
+        if not self.parent_id:
+            return []
+        if hierarchy_index_enabled():
+            return list(
+                Organization.objects.ancestors_of(self, include_self=False).order_by(
+                    "descendant_links__depth"
+                )
+            )
+        ancestors = {org.pk: org for org in self.get_ancestry()}
         fallback_chain = []
-        current = self
-        while current.parent:
-            fallback_chain.append(current.parent)
-            current = current.parent
+        current = ancestors.get(self.parent_id)
+        while current is not None and len(fallback_chain) < len(ancestors):
+            fallback_chain.append(current)
+            current = ancestors.get(current.parent_id)
         return fallback_chain
 
     class Meta:
@@ -98,94 +317,229 @@ class Organization(
                 fields=["parent", "slug"], name="unique_org_slug_per_parent"
             )
         ]
+        indexes = [
+            models.Index(
+                fields=["path"], name="org_path_idx", opclasses=["varchar_pattern_ops"]
+            ),
+            # Keyset pagination of the organization tables.
+            models.Index(fields=["name", "id"], name="org_name_id_idx"),
+            # Trigram search; only created on PostgreSQL (migration 0015).
+            *(
+                GinIndex(
+                    fields=[field],
+                    name=f"org_{field}_trgm_idx",
+                    opclasses=["gin_trgm_ops"],
+                )
+                for field in SEARCH_FIELDS
+            ),
+        ]
 
-class OrganizationLabels(models.Model):
-    organization = models.OneToOneField(
-        Organization, on_delete=models.CASCADE, related_name="labels"
-    )
-    attendee_label = models.CharField(max_length=50, default="Attendee")
-    facility_label = models.CharField(max_length=50, default="Facility")
-    department_label = models.CharField(max_length=50, default="Department")
-    faction_label = models.CharField(max_length=50, default="Faction")
-    sub_faction_label = models.CharField(max_length=50, default="Sub-Faction")
-    faculty_label = models.CharField(max_length=50, default="Faculty")
-    leader_label = models.CharField(max_length=50, default="Leader")
-    quarters_label = models.CharField(max_length=50, default="Quarters")
-    faculty_quarters_label = models.CharField(max_length=50, default="Faculty Quarters")
-    faction_quarters_label = models.CharField(max_length=50, default="Faction Quarters")
-    leader_quarters_label = models.CharField(max_length=50, default="Leader Quarters")
-    attendee_quarters_label = models.CharField(
-        max_length=50, default="Attendee Quarters"
-    )
-    course_label = models.CharField(max_length=50, default="Course")
-    facility_enrollment_label = models.CharField(
-        max_length=50, default="Facility Enrollment"
-    )
-    faction_enrollment_label = models.CharField(
-        max_length=50, default="Faction Enrollment"
+
+class OrganizationClosure(models.Model):
+    """
+    Ancestor/descendant index for the organization hierarchy.
+
+    Holds one row per (ancestor, descendant) pair, including a depth-0 row
+    linking every organization to itself, so a whole subtree or ancestor chain
+    resolves with a single indexed lookup. Rows are maintained by the
+    Organization signals below and removed by cascade on delete.
+    """
+
+    ancestor = models.ForeignKey(
+        Organization, on_delete=models.CASCADE, related_name="descendant_links"
     )
-    leader_enrollment_label = models.CharField(
-        max_length=50, default="Leader Enrollment"
+    descendant = models.ForeignKey(
+        Organization, on_delete=models.CASCADE, related_name="ancestor_links"
     )
-    attendee_enrollment_label = models.CharField(
-        max_length=50, default="Attendee Enrollment"
+    depth = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.ancestor_id} -> {self.descendant_id} ({self.depth})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["ancestor", "descendant"], name="unique_org_closure_link"
+            )
+        ]
+
+
+class OrganizationSearchTerm(models.Model):
+    """
+    Portable search index for organizations.
+
+    Holds one row per distinct word prefix of an organization's name and
+    abbreviation, and per whole word of its description, weighted by where
+    the term occurs. Only maintained when ``conf.search_backend()`` is
+    ``"terms"``; see services.search.
+    """
+
+    organization = models.ForeignKey(
+        Organization, on_delete=models.CASCADE, related_name="search_terms"
     )
-    attendee_class_enrollment_label = models.CharField(
-        max_length=50, default="Attendee Class Enrollment"
+    term = models.CharField(max_length=20)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.term} -> {self.organization_id} ({self.weight})"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["term", "organization"], name="unique_org_search_term"
+            )
+        ]
+
+
+class OrganizationLabels(models.Model):
+    """
+    Label overrides of an organization.
+
+    Only labels that differ from the ones inherited from the parent (the
+    defaults for a root) are stored, in ``overrides``; the effective labels of
+    an organization merge the overrides of its ancestors, root first. Each
+    label is also exposed as a property (e.g. ``labels.attendee_label``) that
+    falls back to the inherited value.
+    """
+
+    organization = models.OneToOneField(
+        Organization, on_delete=models.CASCADE, related_name="labels"
     )
-    week_label = models.CharField(max_length=50, default="Week")
-    period_label = models.CharField(max_length=50, default="Period")
+    overrides = models.JSONField(default=dict, blank=True)
 
     objects = OrganizationLabelsManager()
 
     def __str__(self):
         return f"Labels for {self.organization.name}"
 
+    def save(self, *args, **kwargs):
+        from ..services.labels import invalidate_organization_labels, pluralize
+
+        super().save(*args, **kwargs)
+        invalidate_organization_labels(self.organization_id, using=kwargs.get("using"))
+        # Warm the plural cache while we are off the request path.
+        for value in self.overrides.values():
+            pluralize(value)
+
     def update_labels(self, **kwargs):
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in DEFAULT_LABELS:
                 setattr(self, key, value)
             else:
                 raise ValidationError(f"{key} is not a valid label field.")
         self.save()
 
+    def inherited_labels(self):
+        """
+        Returns the effective labels of the organization's parent, or the
+        defaults for a root organization.
+        """
+        from ..services.labels import get_labels
+
+        if self.organization_id is None:
+            return get_labels(None)
+        return get_labels(self.organization.parent_id)
 
     def add_default_labels(self):
         """
-        Add default labels if they are not set.
-        """
-        default_labels = {
-            "attendee_label": "Attendee",
-            "facility_label": "Facility",
-            "faction_label": "Faction",
-            "sub_faction_label": "Sub-Faction",
-            "faculty_label": "Faculty",
-            "leader_label": "Leader",
-            "faculty_quarters_label": "Faculty Quarters",
-            "faction_quarters_label": "Faction Quarters",
-            "leader_quarters_label": "Leader Quarters",
-            "attendee_quarters_label": "Attendee Quarters",
-            "course_label": "Course",
-            "facility_enrollment_label": "Facility Enrollment",
-            "faction_enrollment_label": "Faction Enrollment",
-            "leader_enrollment_label": "Leader Enrollment",
-            "attendee_enrollment_label": "Attendee Enrollment",
-            "attendee_class_enrollment_label": "Attendee Class Enrollment",
-            "week_label": "Week",
-            "period_label": "Period",
+        Drops blank, unknown and inherited-valued overrides, saving only when
+        something changed.
+        """
+        inherited = self.inherited_labels()
+        overrides = {
+            key: value
+            for key, value in self.overrides.items()
+            if key in DEFAULT_LABELS and value and value != inherited[key]
         }
+        if overrides != self.overrides:
+            self.overrides = overrides
+            self.save()
 
-        for key, value in default_labels.items():
-            if not getattr(self, key):
-                setattr(self, key, value)
-        self.save()
+
+def _label_property(key):
+    def getter(self):
+        if key in self.overrides:
+            return self.overrides[key]
+        return self.inherited_labels()[key]
+
+    def setter(self, value):
+        if value and value != self.inherited_labels()[key]:
+            self.overrides[key] = value
+        else:
+            self.overrides.pop(key, None)
+
+    return property(getter, setter)
+
+
+for _key in DEFAULT_LABELS:
+    setattr(OrganizationLabels, _key, _label_property(_key))
+
+
+@receiver(pre_save, sender=Organization)
+def position_raw_organization(sender, instance, raw, using, **kwargs):
+    from ..services import hierarchy
+
+    if not raw:
+        return
+    # loaddata bypasses Organization.save(); position fixture rows here. Parents
+    # must precede their children in the fixture, or run rebuild_hierarchy.
+    instance.path, instance.depth = hierarchy.position_under_parent(
+        instance, using=using
+    )
+    instance._parent_position = None
 
 
 @receiver(post_save, sender=Organization)
-def ensure_organization_labels(sender, instance, created, **kwargs):
-    labels = getattr(instance, "labels", None)
-    if not labels:
-        if not created:
-            return
-        labels = OrganizationLabels.objects.create(organization=instance)
-    labels.add_default_labels()
+def ensure_organization_labels(sender, instance, created, using, **kwargs):
+    if not created:
+        return
+    # A single INSERT: a new organization overrides nothing, so there is
+    # nothing to validate or invalidate.
+    (labels,) = OrganizationLabels.objects.using(using).bulk_create(
+        [OrganizationLabels(organization=instance)]
+    )
+    instance.labels = labels
+
+
+@receiver(post_save, sender=Organization)
+def maintain_hierarchy_index(sender, instance, created, using, update_fields, **kwargs):
+    from ..services import hierarchy, rollups
+
+    if not created and not writes_parent(update_fields):
+        # The stored parent is unchanged, whatever the instance holds; keep the
+        # loaded parent so a later full save still detects the move.
+        return
+    if created:
+        if hierarchy_index_enabled():
+            hierarchy.index_new_organization(instance, using=using)
+    else:
+        previous_parent_id = getattr(instance, "_loaded_parent_id", _UNKNOWN_PARENT)
+        if previous_parent_id is _UNKNOWN_PARENT and hierarchy_index_enabled():
+            previous_parent_id = hierarchy.indexed_parent_id(instance, using=using)
+        if previous_parent_id is not _UNKNOWN_PARENT and (
+            previous_parent_id != instance.parent_id
+        ):
+            rollups.move_subtree_totals(instance, previous_parent_id, using=using)
+            if hierarchy_index_enabled():
+                hierarchy.reindex_moved_organization(instance, using=using)
+    instance._loaded_parent_id = instance.parent_id
+
+
+@receiver(post_save, sender=Organization)
+def maintain_search_index(sender, instance, created, using, **kwargs):
+    from ..services import search
+
+    if search_backend(using) != "terms":
+        return
+    search_text = instance.search_text(default=_UNKNOWN_PARENT)
+    if created or search_text != getattr(instance, "_loaded_search_text", None):
+        search.index_organizations([instance], using=using)
+    instance._loaded_search_text = search_text
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_organization_tree(sender, using, **kwargs):
+    from ..services.tree import bump_tree_version
+
+    bump_tree_version(using=using)
@@ -1,12 +1,110 @@
 # organization/querysets/organization.py
 
-from django.db import models
+from django.db import NotSupportedError, connections, models, transaction
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+from django.utils.text import slugify
 
 from faction.models.faction import Faction
 
+from ..conf import hierarchy_index_enabled, search_backend
+
+RECURSIVE_CTE_VENDORS = {"postgresql", "sqlite", "mysql"}
+
+ROLLUP_RELATIONS = ("factions", "facilities", "attendees")
+
+
+class SubtreeCount(models.Expression):
+    """
+    Counts rows of a reverse relation across an organization's whole subtree
+    with a correlated ``WITH RECURSIVE`` subquery. Used for annotations when
+    the hierarchy index is disabled.
+    """
+
+    output_field = models.IntegerField()
+
+    def __init__(self, relation):
+        super().__init__()
+        self.relation = relation
+        self.organization = models.F("pk")
+
+    def get_source_expressions(self):
+        return [self.organization]
+
+    def set_source_expressions(self, exprs):
+        (self.organization,) = exprs
+
+    def as_sql(self, compiler, connection):
+        if connection.vendor not in RECURSIVE_CTE_VENDORS:
+            raise NotSupportedError(
+                "Subtree counts without the hierarchy index need WITH RECURSIVE."
+            )
+        quote = connection.ops.quote_name
+        meta = self.organization.target.model._meta
+        related = meta.get_field(self.relation)
+        organization_sql, params = compiler.compile(self.organization)
+        table = quote(meta.db_table)
+        pk = quote(meta.pk.column)
+        parent = quote(meta.get_field("parent").column)
+        related_table = quote(related.related_model._meta.db_table)
+        related_column = quote(related.field.column)
+        sql = (
+            f"(WITH RECURSIVE subtree(id) AS (SELECT {organization_sql} "
+            f"UNION SELECT node.{pk} FROM {table} node "
+            f"INNER JOIN subtree ON node.{parent} = subtree.id) "
+            f"SELECT COUNT(*) FROM {related_table} related "
+            f"WHERE related.{related_column} IN (SELECT id FROM subtree))"
+        )
+        return sql, params
+
 
 class OrganizationLabelsQuerySet(models.QuerySet):
-    pass
+    def for_organizations(self, organization_ids):
+        """
+        Resolves the effective labels of many organizations at once.
+
+        Each organization merges the label overrides of its ancestors, root
+        first. The ancestors are read from the stored paths and every override
+        in the chain is fetched in one more query, so the cost does not depend
+        on how many ids are passed.
+
+        Args:
+            organization_ids (Iterable[int]): The organizations to resolve.
+
+        Returns:
+            dict: Label bundles (singular and plural) keyed by organization id.
+                Unknown ids are omitted.
+        """
+
+        from ..services.labels import (
+            DEFAULT_LABELS,
+            PLURAL_EXCEPTIONS,
+            add_pluralized_labels,
+            merge_overrides,
+        )
+
+        organization_model = self.model._meta.get_field("organization").related_model
+        positions = organization_model._base_manager.using(self.db).filter(
+            pk__in=set(organization_ids)
+        )
+        chains = {
+            pk: [int(ancestor) for ancestor in path.split("/") if ancestor] + [pk]
+            for pk, path in positions.values_list("pk", "path")
+        }
+        if not chains:
+            return {}
+        overrides = dict(
+            self.filter(
+                organization_id__in={pk for chain in chains.values() for pk in chain}
+            ).values_list("organization_id", "overrides")
+        )
+        labels = {}
+        for pk, chain in chains.items():
+            merged = dict(DEFAULT_LABELS)
+            for ancestor_id in chain:
+                merged.update(merge_overrides(overrides.get(ancestor_id, {})))
+            labels[pk] = add_pluralized_labels(merged, PLURAL_EXCEPTIONS)
+        return labels
 
 
 class OrganizationQuerySet(models.QuerySet):
@@ -20,6 +118,100 @@ class OrganizationQuerySet(models.QuerySet):
         has_factions(): Returns a QuerySet containing organizations that have factions.
     """
 
+    def bulk_create(self, objs, batch_size=None, **kwargs):
+        """
+        Inserts organizations in bulk, doing what ``save()`` and the post_save
+        signals would: slugs, ``path`` and ``depth``, the hierarchy index, the
+        labels rows, the search terms and the tree version.
+
+        Organizations may reference parents from the same batch (``parent=``
+        an unsaved instance); they are inserted one tree level at a time, so
+        the number of queries grows with the depth of the batch, not its size.
+        Validation is left to the caller.
+
+        Returns:
+            list: The inserted organizations, with primary keys set.
+        """
+
+        from ..services import hierarchy, search
+        from ..services.tree import bump_tree_version
+
+        if kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts"):
+            raise ValueError(
+                "Organization bulk_create() does not support conflict handling."
+            )
+        objs = list(objs)
+        if not objs:
+            return objs
+        self._for_write = True
+        labels_model = self.model._meta.get_field("labels").related_model
+        with transaction.atomic(using=self.db, savepoint=False):
+            for level in self._batch_levels(objs):
+                for organization in level:
+                    if not organization.slug:
+                        organization.slug = slugify(organization.name)
+                hierarchy.position_new_organizations(level, using=self.db)
+                super().bulk_create(level, batch_size=batch_size, **kwargs)
+                if any(organization.pk is None for organization in level):
+                    self._fetch_inserted_pks(level)
+                for organization in level:
+                    organization._loaded_parent_id = organization.parent_id
+                    organization._loaded_search_text = organization.search_text()
+            if hierarchy_index_enabled():
+                hierarchy.index_new_organizations(objs, using=self.db)
+            labels_model.objects.using(self.db).bulk_create(
+                [labels_model(organization=organization) for organization in objs],
+                batch_size=batch_size,
+            )
+            if search_backend(self.db) == "terms":
+                search.index_organizations(objs, using=self.db, replace=False)
+            bump_tree_version(using=self.db)
+        return objs
+
+    def delete(self):
+        from ..services.rollups import tracking_deletes
+
+        with tracking_deletes():
+            return super().delete()
+
+    def _batch_levels(self, objs):
+        """
+        Groups a batch by depth below its saved part, so every parent is
+        inserted before its children.
+        """
+
+        parent_field = self.model._meta.get_field("parent")
+        in_batch = {id(organization) for organization in objs}
+        levels = {}
+
+        def level_of(organization, seen=()):
+            key = id(organization)
+            if key not in levels:
+                if key in seen:
+                    raise ValueError("Organizations in a batch cannot form a cycle.")
+                parent = parent_field.get_cached_value(organization, None)
+                if parent is None or id(parent) not in in_batch:
+                    levels[key] = 0
+                else:
+                    levels[key] = level_of(parent, (*seen, key)) + 1
+            return levels[key]
+
+        grouped = {}
+        for organization in objs:
+            grouped.setdefault(level_of(organization), []).append(organization)
+        return [grouped[level] for level in sorted(grouped)]
+
+    def _fetch_inserted_pks(self, level):
+        # Backends that cannot return ids from a bulk INSERT: match the rows
+        # back on the (parent, slug) pairs that the unique constraint covers.
+        rows = self.filter(slug__in={organization.slug for organization in level})
+        inserted = {
+            (parent_id, slug): pk
+            for pk, parent_id, slug in rows.values_list("pk", "parent_id", "slug")
+        }
+        for organization in level:
+            organization.pk = inserted.get((organization.parent_id, organization.slug))
+
     def top_level(self):
         """
         Returns a QuerySet containing only the top-level organizations.
@@ -43,28 +235,270 @@ class OrganizationQuerySet(models.QuerySet):
     def active(self):
         return self.filter(is_active=True)
 
+    def search(self, query, within=None):
+        """
+        Returns the organizations matching ``query`` by name, abbreviation and
+        description, best match first, annotated with ``search_rank``.
+
+        Args:
+            query (str): The text to search for.
+            within (Organization | int | None): Only search this subtree.
+        """
+
+        from ..services.search import search_organizations
+
+        return search_organizations(query, queryset=self, within=within)
+
     def search_by_name(self, name):
-        return self.filter(name__icontains=name)
+        return self.search(name)
 
     def children_of(self, parent_id):
         return self.filter(parent__id=parent_id)
 
+    def descendants_of(self, organization, include_self=True):
+        """
+        Returns a QuerySet containing every organization below the given one.
+
+        Resolved through the hierarchy index in a single query, however deep
+        the subtree is.
+
+        Args:
+            organization (Organization | int): The subtree root or its id.
+            include_self (bool): Whether to include the subtree root itself.
+
+        Returns:
+            QuerySet: A QuerySet containing the organizations in the subtree.
+        """
+
+        return self.filter(
+            ancestor_links__ancestor_id=getattr(organization, "pk", organization),
+            ancestor_links__depth__gte=0 if include_self else 1,
+        )
+
+    def ancestors_of(self, organization, include_self=True):
+        """
+        Returns a QuerySet containing every organization above the given one.
+
+        Resolved through the hierarchy index in a single query, however deep
+        the organization sits.
+
+        Args:
+            organization (Organization | int): The organization or its id.
+            include_self (bool): Whether to include the organization itself.
+
+        Returns:
+            QuerySet: A QuerySet containing the organization's ancestors.
+        """
+
+        return self.filter(
+            descendant_links__descendant_id=getattr(organization, "pk", organization),
+            descendant_links__depth__gte=0 if include_self else 1,
+        )
+
+    def with_descendants(self):
+        """
+        Returns a QuerySet containing these organizations and everything below them.
+
+        Resolves through the hierarchy index when it is enabled. Otherwise it
+        compiles to a single ``WITH RECURSIVE`` subquery on backends that
+        support it, so the result stays lazy and chainable and costs one round
+        trip however deep the tree is. Other backends fall back to one query
+        per tree level.
+
+        Returns:
+            QuerySet: A QuerySet containing the organizations and their descendants.
+        """
+
+        return self._walk_hierarchy(descending=True)
+
+    def with_ancestors(self):
+        """
+        Returns a QuerySet containing these organizations and everything above them.
+
+        Resolves through the hierarchy index when it is enabled, otherwise
+        compiles to a single ``WITH RECURSIVE`` subquery on backends that
+        support it, falling back to one query per tree level elsewhere.
+
+        Returns:
+            QuerySet: A QuerySet containing the organizations and their ancestors.
+        """
+
+        return self._walk_hierarchy(descending=False)
+
+    def _walk_hierarchy(self, descending):
+        seed = self.order_by().values("pk")
+        base = self.__class__(model=self.model, using=self._db)
+        if hierarchy_index_enabled():
+            closure = self.model._meta.get_field("ancestor_links").related_model
+            if descending:
+                links = closure.objects.filter(ancestor_id__in=seed).values(
+                    "descendant_id"
+                )
+            else:
+                links = closure.objects.filter(descendant_id__in=seed).values(
+                    "ancestor_id"
+                )
+            return base.filter(pk__in=links)
+
+        connection = connections[self.db]
+        if connection.vendor not in RECURSIVE_CTE_VENDORS:
+            return base.filter(pk__in=self._walk_levels(seed, descending))
+
+        quote = connection.ops.quote_name
+        meta = self.model._meta
+        table = quote(meta.db_table)
+        pk = quote(meta.pk.column)
+        parent = quote(meta.get_field("parent").column)
+        if descending:
+            step = (
+                f"SELECT node.{pk} FROM {table} node "
+                f"INNER JOIN hierarchy ON node.{parent} = hierarchy.id"
+            )
+        else:
+            step = (
+                f"SELECT node.{parent} FROM {table} node "
+                f"INNER JOIN hierarchy ON node.{pk} = hierarchy.id "
+                f"WHERE node.{parent} IS NOT NULL"
+            )
+        seed_sql, seed_params = seed.query.get_compiler(using=self.db).as_sql()
+        sql = (
+            f"WITH RECURSIVE hierarchy(id) AS ("
+            f"SELECT {pk} FROM {table} WHERE {pk} IN ({seed_sql}) "
+            f"UNION {step}"
+            f") SELECT id FROM hierarchy"
+        )
+        return base.filter(pk__in=RawSQL(sql, seed_params))
+
+    def _walk_levels(self, seed, descending):
+        base = self.__class__(model=self.model, using=self._db)
+        found = set(seed.values_list("pk", flat=True))
+        frontier = found
+        while frontier:
+            if descending:
+                level = base.filter(parent_id__in=frontier).values_list("pk", flat=True)
+            else:
+                level = base.filter(pk__in=frontier, parent__isnull=False).values_list(
+                    "parent_id", flat=True
+                )
+            frontier = set(level) - found
+            found |= frontier
+        return found
+
+    def with_subtree_counts(self, relations=ROLLUP_RELATIONS):
+        """
+        Annotates every organization with subtree-inclusive related counts.
+
+        Adds a ``total_<relation>_count`` annotation (factions, facilities and
+        attendees by default) computed in the same SQL statement, so a page of
+        organizations costs one query regardless of tree depth.
+
+        Args:
+            relations (Iterable[str]): Reverse relation names to count.
+
+        Returns:
+            QuerySet: The annotated QuerySet.
+        """
+
+        return self.annotate(
+            **{
+                f"total_{relation}_count": self._subtree_count(relation)
+                for relation in relations
+            }
+        )
+
+    def with_direct_counts(self, relations=ROLLUP_RELATIONS):
+        """
+        Annotates every organization with ``direct_<relation>_count``, the
+        number of related rows attached to the organization itself, in the same
+        SQL statement.
+
+        Args:
+            relations (Iterable[str]): Reverse relation names to count.
+
+        Returns:
+            QuerySet: The annotated QuerySet.
+        """
+
+        return self.annotate(
+            **{
+                f"direct_{relation}_count": self._direct_count(relation)
+                for relation in relations
+            }
+        )
+
+    def with_total_factions_count(self):
+        """
+        Annotates every organization with ``total_factions_count``, the number of
+        factions in the organization and all of its descendants.
+
+        Returns:
+            QuerySet: The annotated QuerySet.
+        """
+
+        return self.with_subtree_counts(relations=("factions",))
+
+    def recompute_rollups(self, relations=ROLLUP_RELATIONS):
+        """
+        Recomputes the cached direct and subtree counters from the source tables.
+
+        Used to repair drift in the incrementally maintained ``<relation>_count``
+        and ``subtree_<relation>_count`` columns.
+
+        Args:
+            relations (Iterable[str]): Reverse relation names to recompute.
+
+        Returns:
+            int: The number of organizations updated.
+        """
+
+        from ..services.rollups import bump_rollup_version
+
+        updates = {}
+        for relation in relations:
+            updates[f"{relation}_count"] = self._direct_count(relation)
+            updates[f"subtree_{relation}_count"] = self._subtree_count(relation)
+        updated = self.update(**updates)
+        bump_rollup_version(self.db)
+        return updated
+
+    def _direct_count(self, relation):
+        related = self.model._meta.get_field(relation)
+        rows = related.related_model._base_manager.filter(
+            **{related.field.attname: models.OuterRef("pk")}
+        )
+        return self._count_subquery(rows)
+
+    def _subtree_count(self, relation):
+        if not hierarchy_index_enabled():
+            return SubtreeCount(relation)
+        related = self.model._meta.get_field(relation)
+        closure = self.model._meta.get_field("ancestor_links").related_model
+        subtree = closure.objects.filter(
+            ancestor_id=models.OuterRef(models.OuterRef("pk"))
+        ).values("descendant_id")
+        rows = related.related_model._base_manager.filter(
+            **{f"{related.field.attname}__in": subtree}
+        )
+        return self._count_subquery(rows)
+
+    @staticmethod
+    def _count_subquery(rows):
+        # COUNT without GROUP BY, so the subquery never joins the organization
+        # table and can be used in UPDATE statements on every backend.
+        totals = (
+            rows.order_by()
+            .annotate(total=models.Func(models.F("pk"), function="COUNT"))
+            .values("total")
+        )
+        return Coalesce(models.Subquery(totals, output_field=models.IntegerField()), 0)
+
     def with_all_factions(self):
         """
         This method returns a queryset of organizations with all their factions,
         including those from child organizations.
-        """
-
-        def get_descendants_ids(org):
-            descendants = [org.id]
-            for child in org.children.all():
-                descendants.extend(get_descendants_ids(child))
-            return descendants
 
-        # Generate Q objects for filtering factions based on organization hierarchy
-        q_objects = models.ManyToManyFieldQ()
-        for org in self:
-            descendant_ids = get_descendants_ids(org)
-            q_objects |= models.Q(organization_id__in=descendant_ids)
+        The union of every subtree is computed set-wise, so the cost does not
+        grow with the number of organizations in this queryset.
+        """
 
-        return Faction.objects.filter(q_objects).distinct()
+        return Faction.objects.filter(organization__in=self.with_descendants())
@@ -1,15 +1,127 @@
+from django.db.models import F
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 
+from organization.conf import rollup_counters_enabled
 from organization.models.organization import Organization
+from organization.querysets.organization import ROLLUP_RELATIONS
+from organization.services import tree
+
+# Columns OrganizationTable renders, plus the slug its action URLs use.
+TABLE_COLUMNS = (
+    "name",
+    "slug",
+    "description",
+    "abbreviation",
+    "max_depth",
+    "parent__name",
+)
 
 
 def organization_queryset():
     return Organization.objects.all()
 
 
+def organization_table_queryset(queryset=None):
+    """
+    Returns organizations loading only what OrganizationTable renders: its
+    columns, the parent's name in the same query, and subtree totals read
+    from the cached counters when they are maintained.
+    """
+
+    if queryset is None:
+        queryset = organization_queryset()
+    queryset = queryset.select_related("parent").only(*TABLE_COLUMNS)
+    if not rollup_counters_enabled():
+        return queryset.with_subtree_counts()
+    return queryset.annotate(
+        **{
+            f"total_{relation}_count": F(f"subtree_{relation}_count")
+            for relation in ROLLUP_RELATIONS
+        }
+    )
+
+
+def organization_detail_queryset():
+    """
+    Returns organizations with the parent and labels joined, and the direct
+    and subtree counts annotated when the cached counters are not maintained,
+    so a detail page renders from a single query.
+    """
+
+    queryset = organization_queryset().select_related("parent", "labels")
+    if rollup_counters_enabled():
+        return queryset
+    return queryset.with_direct_counts().with_subtree_counts()
+
+
+def organization_summary(organization):
+    """
+    Returns the direct and subtree counts of an organization loaded through
+    ``organization_detail_queryset()``, keyed by relation.
+    """
+
+    if rollup_counters_enabled():
+        direct, subtree = "{relation}_count", "subtree_{relation}_count"
+    else:
+        direct, subtree = "direct_{relation}_count", "total_{relation}_count"
+    return {
+        relation: {
+            "direct": getattr(organization, direct.format(relation=relation)),
+            "subtree": getattr(organization, subtree.format(relation=relation)),
+        }
+        for relation in ROLLUP_RELATIONS
+    }
+
+
 def root_organizations_queryset():
     return organization_queryset().filter(parent__isnull=True)
 
 
-def get_organization_by_slug(slug):
-    return get_object_or_404(Organization, slug=slug)
+def resolve_organization_id(slug_or_path):
+    """
+    Returns the id of the organization at a slug or a slug path from a root
+    (``"council/district/unit"``), or None when there is none or when a bare
+    slug is shared by organizations under different parents.
+
+    Resolved from the process-local tree snapshot, so no query is made while
+    no organization has been saved, renamed, moved or deleted.
+    """
+
+    if "/" in slug_or_path.strip("/"):
+        return tree.resolve_path(slug_or_path)
+    return tree.resolve_slug(slug_or_path.strip("/"))
+
+
+def resolve_organization_path(path):
+    """
+    Returns the id of the organization at a slug path from a root, or None.
+
+    Unlike ``resolve_organization_id()``, a single segment only matches a
+    root organization, never a bare slug further down the tree.
+    """
+
+    return tree.resolve_path(path)
+
+
+def get_organization_by_slug(slug, request=None):
+    """
+    Returns the organization at a slug or slug path, raising Http404 when it
+    does not exist or the slug is ambiguous.
+
+    When a request is given, the result is memoized on it, so resolving the
+    same slug again during the request costs nothing.
+    """
+
+    memo = None
+    if request is not None:
+        memo = request.__dict__.setdefault("_organizations_by_slug", {})
+        if slug in memo:
+            return memo[slug]
+    organization_id = resolve_organization_id(slug)
+    if organization_id is None:
+        raise Http404("No organization matches the given query.")
+    organization = get_object_or_404(organization_queryset(), pk=organization_id)
+    if memo is not None:
+        memo[slug] = organization
+    return organization
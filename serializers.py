@@ -4,8 +4,66 @@ from rest_framework import serializers
 
 from .models.organization import Organization
 
+# Model fields each serializer field reads, when they differ from its name.
+FIELD_SOURCES = {
+    "parent_slug": ("parent__slug",),
+}
+
+
+def requested_fields(request):
+    """
+    Returns the field names listed in a request's ``?fields=`` parameter, or
+    None when the parameter is absent.
+    """
+
+    if request is None:
+        return None
+    fields = request.query_params.get("fields")
+    if not fields:
+        return None
+    return {name.strip() for name in fields.split(",") if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    Limits a serializer's output to the fields named in ``?fields=``.
+    Unknown names are ignored.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        requested = requested_fields(self.context.get("request"))
+        if requested and requested & set(self.fields):
+            for name in set(self.fields) - requested:
+                self.fields.pop(name)
+
+
+class OrganizationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    parent_slug = serializers.SlugRelatedField(
+        source="parent", slug_field="slug", read_only=True
+    )
 
-class OrganizationSerializer(serializers.ModelSerializer):
     class Meta:
         model = Organization
-        fields = "__all_"
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "abbreviation",
+            "description",
+            "parent",
+            "parent_slug",
+            "depth",
+            "max_depth",
+            "is_active",
+            "image",
+            "address",
+            "factions_count",
+            "facilities_count",
+            "attendees_count",
+            "subtree_factions_count",
+            "subtree_facilities_count",
+            "subtree_attendees_count",
+            "created_at",
+            "updated_at",
+        ]
@@ -0,0 +1,141 @@
+# organization/services/autocomplete.py
+
+import threading
+from bisect import bisect_left
+
+from django.db import router
+
+from ..models.organization import Organization
+from .search import normalize_words
+from .tree import get_tree
+
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 50
+PATH_SEPARATOR = " › "
+
+# Sorts after any character a word can continue with.
+_LAST_CHARACTER = chr(0x10FFFF)
+
+_lock = threading.Lock()
+
+
+class AutocompleteIndex:
+    """
+    Immutable, process-local prefix index of organization names and
+    abbreviations.
+
+    Holds every (word, id) pair sorted by word, so the organizations with a
+    word starting with a prefix are found by bisection, and the names needed
+    to spell out an organization's path. Built from a tree snapshot and
+    memoized on it.
+    """
+
+    __slots__ = ("tree", "entries", "names", "words")
+
+    def __init__(self, tree, rows):
+        self.tree = tree
+        self.names = {}
+        self.words = {}
+        entries = []
+        for pk, name, abbreviation in rows:
+            words = tuple(
+                dict.fromkeys(normalize_words(f"{name} {abbreviation or ''}"))
+            )
+            self.names[pk] = name
+            self.words[pk] = words
+            entries.extend((word, pk) for word in words)
+        entries.sort()
+        self.entries = entries
+
+    def path(self, pk):
+        """
+        Returns the names from the root down to the organization, joined with
+        ``PATH_SEPARATOR``, or None for an unknown id.
+        """
+
+        if pk not in self.names:
+            return None
+        chain = self.tree.ancestors(pk, include_self=True)
+        return PATH_SEPARATOR.join(
+            self.names[ancestor]
+            for ancestor in reversed(chain)
+            if ancestor in self.names
+        )
+
+    def search(self, query, limit=AUTOCOMPLETE_LIMIT):
+        """
+        Returns the ids of up to ``limit`` organizations with a name or
+        abbreviation word starting with each word of ``query``, in the order
+        of the matched words.
+        """
+
+        words = list(dict.fromkeys(normalize_words(query)))
+        if not words or limit <= 0:
+            return []
+        # Walk the entries of the word with the fewest; check the others per match.
+        spans = {word: self._span(word) for word in words}
+        prefix = min(words, key=lambda word: spans[word][1] - spans[word][0])
+        others = [word for word in words if word != prefix]
+        matches = []
+        for position in range(*spans[prefix]):
+            pk = self.entries[position][1]
+            if pk in matches:
+                continue
+            if all(
+                any(candidate.startswith(other) for candidate in self.words[pk])
+                for other in others
+            ):
+                matches.append(pk)
+                if len(matches) == limit:
+                    break
+        return matches
+
+    def _span(self, prefix):
+        # Entries whose word starts with ``prefix`` sit between these positions.
+        return (
+            bisect_left(self.entries, (prefix,)),
+            bisect_left(self.entries, (prefix + _LAST_CHARACTER,)),
+        )
+
+
+def get_index():
+    """
+    Returns the autocomplete index of the current tree snapshot, built in one
+    query the first time it is needed and discarded with the snapshot.
+    """
+
+    tree = get_tree()
+    index = tree.derived.get("autocomplete")
+    if index is None:
+        with _lock:
+            index = tree.derived.get("autocomplete")
+            if index is None:
+                using = tree.using or router.db_for_read(Organization)
+                rows = Organization.objects.using(using).values_list(
+                    "pk", "name", "abbreviation"
+                )
+                index = AutocompleteIndex(tree, rows.iterator())
+                tree.derived["autocomplete"] = index
+    return index
+
+
+def autocomplete(query, limit=AUTOCOMPLETE_LIMIT):
+    """
+    Returns the organizations matching ``query`` as ``{"id", "name", "path"}``
+    dicts, without a query while the index is current.
+    """
+
+    index = get_index()
+    return [
+        {"id": pk, "name": index.names[pk], "path": index.path(pk)}
+        for pk in index.search(query, limit=limit)
+    ]
+
+
+def path_label(pk):
+    """
+    Returns an organization's path from the root, e.g. "Council › District",
+    or None for an unknown id.
+    """
+
+    return get_index().path(pk)
@@ -0,0 +1,150 @@
+# organization/services/exporter.py
+
+import csv
+import json
+
+from django.db import connections
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Collate, Concat
+
+from ..models.organization import (
+    DEFAULT_LABELS,
+    ROLLUP_COUNTER_FIELDS,
+    Organization,
+    OrganizationLabels,
+)
+from .labels import merge_overrides
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FIELDS = (
+    "id",
+    "name",
+    "slug",
+    "parent",
+    "depth",
+    "abbreviation",
+    "description",
+    "is_active",
+    "address",
+    *ROLLUP_COUNTER_FIELDS,
+    *DEFAULT_LABELS,
+)
+
+
+def export_queryset(root=None):
+    """
+    Returns the organizations to export, in pre-order: every organization is
+    followed by its whole subtree.
+
+    Args:
+        root (Organization | None): Only export this organization's subtree.
+    """
+
+    organizations = Organization.objects.all()
+    if root is not None:
+        organizations = organizations.filter(pk=root.pk).with_descendants()
+    export_path = Concat(
+        "path", Cast("pk", CharField()), Value("/"), output_field=CharField()
+    )
+    if connections[organizations.db].vendor == "postgresql":
+        # Locale collations skip the "/" separators; sort bytewise instead.
+        export_path = Collate(export_path, "C")
+    return (
+        organizations.select_related("parent", "labels", "address")
+        .annotate(export_path=export_path)
+        .order_by("export_path")
+    )
+
+
+def export_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yields one dict per organization of a pre-ordered ``export_queryset()``,
+    with its effective labels and cached rollup counts.
+
+    Rows are read with a server-side iterator and inherited labels are kept
+    on a stack as deep as the tree, so memory use does not grow with the
+    number of organizations.
+    """
+
+    # (subtree path, effective labels) of the organizations above the current one.
+    stack = []
+    for organization in queryset.iterator(chunk_size=chunk_size):
+        while stack and not organization.path.startswith(stack[-1][0]):
+            stack.pop()
+        if stack:
+            inherited = stack[-1][1]
+        else:
+            inherited = _ancestor_labels(organization)
+        labels = {**inherited, **merge_overrides(_overrides(organization))}
+        stack.append((organization.export_path, labels))
+
+        row = {
+            "id": organization.pk,
+            "name": organization.name,
+            "slug": organization.slug,
+            "parent": organization.parent.slug if organization.parent_id else "",
+            "depth": organization.depth,
+            "abbreviation": organization.abbreviation or "",
+            "description": organization.description or "",
+            "is_active": organization.is_active,
+            "address": str(organization.address) if organization.address_id else "",
+        }
+        row.update(
+            (field, getattr(organization, field)) for field in ROLLUP_COUNTER_FIELDS
+        )
+        row.update(labels)
+        yield row
+
+
+def _overrides(organization):
+    try:
+        return organization.labels.overrides
+    except OrganizationLabels.DoesNotExist:
+        return {}
+
+
+def _ancestor_labels(organization):
+    # Only the first row of a subtree export has ancestors outside the export.
+    labels = dict(DEFAULT_LABELS)
+    ancestor_ids = [int(pk) for pk in organization.path.split("/") if pk]
+    if ancestor_ids:
+        chain = dict(
+            OrganizationLabels.objects.filter(
+                organization_id__in=ancestor_ids
+            ).values_list("organization_id", "overrides")
+        )
+        for ancestor_id in ancestor_ids:
+            labels.update(merge_overrides(chain.get(ancestor_id, {})))
+    return labels
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    """
+    Yields CSV lines, header first, as the rows are produced.
+    """
+
+    writer = csv.DictWriter(_Echo(), fieldnames=EXPORT_FIELDS)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_jsonl(rows):
+    """
+    Yields one JSON document per line as the rows are produced.
+    """
+
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+EXPORT_FORMATS = {
+    "csv": (stream_csv, "text/csv"),
+    "jsonl": (stream_jsonl, "application/x-ndjson"),
+}
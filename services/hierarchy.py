@@ -0,0 +1,346 @@
+# organization/services/hierarchy.py
+
+from django.core.exceptions import ValidationError
+from django.db import connections, router
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Concat, Substr
+
+from ..models.organization import POSITION_FIELDS, Organization, OrganizationClosure
+
+_NOT_LOADED = object()
+
+
+def _closure_columns():
+    meta = OrganizationClosure._meta
+    return (
+        meta.db_table,
+        meta.get_field("ancestor").column,
+        meta.get_field("descendant").column,
+        meta.get_field("depth").column,
+    )
+
+
+def _link_subtree(subtree_root_id, parent_id, using):
+    """
+    Links every node under ``subtree_root_id`` to ``parent_id`` and all of its
+    ancestors with a single INSERT ... SELECT.
+    """
+
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    table, ancestor, descendant, depth = (quote(name) for name in _closure_columns())
+    sql = (
+        f"INSERT INTO {table} ({ancestor}, {descendant}, {depth}) "
+        f"SELECT a.{ancestor}, d.{descendant}, a.{depth} + d.{depth} + 1 "
+        f"FROM {table} a CROSS JOIN {table} d "
+        f"WHERE a.{descendant} = %s AND d.{ancestor} = %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [parent_id, subtree_root_id])
+
+
+def position_under_parent(organization, using=None):
+    """
+    Returns the ``(path, depth)`` an organization has under its current parent.
+
+    Reads the parent's stored path in one query and memoizes the result on the
+    instance for the rest of the save, so ``clean()`` and ``save()`` share it.
+
+    Args:
+        organization (Organization): The organization to position.
+        using (str): The database alias to read from.
+
+    Returns:
+        tuple: The ancestor path (e.g. ``"1/5/"``) and the depth.
+    """
+
+    cached = getattr(organization, "_parent_position", None)
+    if cached is not None and cached[0] == organization.parent_id:
+        return cached[1:]
+    if not organization.parent_id:
+        position = ("", 0)
+    else:
+        using = using or router.db_for_read(Organization, instance=organization)
+        parent = (
+            Organization.objects.using(using)
+            .filter(pk=organization.parent_id)
+            .values_list("path", "depth")
+            .first()
+        )
+        parent_path, parent_depth = parent or ("", 0)
+        position = (f"{parent_path}{organization.parent_id}/", parent_depth + 1)
+    organization._parent_position = (organization.parent_id, *position)
+    return position
+
+
+def previous_position(organization, using=None):
+    """
+    Returns the stored parent, path and depth of an organization that is being
+    re-parented, or None when its parent is unchanged.
+
+    Costs no query when the parent is unchanged since the instance was loaded.
+    """
+
+    loaded_parent_id = getattr(organization, "_loaded_parent_id", _NOT_LOADED)
+    if loaded_parent_id == organization.parent_id:
+        return None
+    using = using or router.db_for_read(Organization, instance=organization)
+    stored = (
+        Organization.objects.using(using)
+        .filter(pk=organization.pk)
+        .values("parent_id", "path", "depth")
+        .first()
+    )
+    if stored is None:
+        return None
+    organization._loaded_parent_id = stored["parent_id"]
+    if stored["parent_id"] == organization.parent_id:
+        return None
+    return stored
+
+
+def validate_subtree_depth(organization, previous, using=None):
+    """
+    Checks that moving an organization keeps every descendant within its own
+    ``max_depth``, with a single EXISTS query.
+
+    Raises:
+        ValidationError: If a descendant would end up too deep.
+    """
+
+    delta = organization.depth - previous["depth"]
+    if delta <= 0:
+        return
+    using = using or router.db_for_read(Organization, instance=organization)
+    too_deep = (
+        Organization.objects.using(using)
+        .filter(
+            path__startswith=f"{previous['path']}{organization.pk}/",
+            max_depth__lt=F("depth") + delta,
+        )
+        .exists()
+    )
+    if too_deep:
+        raise ValidationError(
+            "Maximum hierarchy depth exceeded by a descendant organization"
+        )
+
+
+def rewrite_subtree_paths(organization, previous, using=None):
+    """
+    Rewrites the path and depth of every descendant of a moved organization
+    with a single UPDATE.
+
+    Args:
+        organization (Organization): The moved organization, already saved.
+        previous (dict): Its stored ``path`` and ``depth`` before the move.
+        using (str): The database alias to write to.
+    """
+
+    old_prefix = f"{previous['path']}{organization.pk}/"
+    new_prefix = organization.tree_path
+    if old_prefix == new_prefix:
+        return
+    using = using or router.db_for_write(Organization, instance=organization)
+    Organization.objects.using(using).filter(path__startswith=old_prefix).update(
+        path=Concat(
+            Value(new_prefix),
+            Substr("path", len(old_prefix) + 1),
+            output_field=CharField(),
+        ),
+        depth=F("depth") + (organization.depth - previous["depth"]),
+    )
+
+
+def index_new_organization(organization, using=None):
+    """
+    Adds the closure rows for a freshly inserted organization: a depth-0 row
+    for itself plus one row per ancestor of its parent.
+
+    Args:
+        organization (Organization): The organization that was just created.
+        using (str): The database alias to write to.
+    """
+
+    using = using or router.db_for_write(Organization, instance=organization)
+    OrganizationClosure.objects.using(using).create(
+        ancestor_id=organization.pk, descendant_id=organization.pk, depth=0
+    )
+    if organization.parent_id:
+        _link_subtree(organization.pk, organization.parent_id, using)
+
+
+def position_new_organizations(organizations, using=None):
+    """
+    Sets ``path`` and ``depth`` on unsaved organizations whose parents are
+    either saved already or cached on the instance with a primary key.
+
+    Parents only known by id are read in a single query.
+
+    Args:
+        organizations (list): The organizations about to be inserted.
+        using (str): The database alias to read from.
+    """
+
+    parent_field = Organization._meta.get_field("parent")
+    positions = {}
+    for organization in organizations:
+        parent = parent_field.get_cached_value(organization, None)
+        if parent is not None and parent.pk is not None:
+            organization.parent_id = parent.pk
+            positions[parent.pk] = (parent.path, parent.depth)
+    missing = {
+        organization.parent_id
+        for organization in organizations
+        if organization.parent_id and organization.parent_id not in positions
+    }
+    if missing:
+        using = using or router.db_for_read(Organization)
+        rows = Organization.objects.using(using).filter(pk__in=missing)
+        positions.update(
+            (pk, (path, depth))
+            for pk, path, depth in rows.values_list("pk", "path", "depth")
+        )
+    for organization in organizations:
+        if organization.parent_id:
+            parent_path, parent_depth = positions.get(organization.parent_id, ("", 0))
+            organization.path = f"{parent_path}{organization.parent_id}/"
+            organization.depth = parent_depth + 1
+        else:
+            organization.path, organization.depth = "", 0
+
+
+def index_new_organizations(organizations, using=None):
+    """
+    Adds the closure rows for freshly bulk-inserted organizations in batched
+    INSERTs, from their stored paths.
+
+    Args:
+        organizations (list): Saved organizations with ``path`` and ``depth`` set.
+        using (str): The database alias to write to.
+    """
+
+    using = using or router.db_for_write(Organization)
+    links = []
+    for organization in organizations:
+        links.append(
+            OrganizationClosure(
+                ancestor_id=organization.pk, descendant_id=organization.pk, depth=0
+            )
+        )
+        ancestors = [int(pk) for pk in organization.path.split("/") if pk]
+        links.extend(
+            OrganizationClosure(
+                ancestor_id=ancestor_id,
+                descendant_id=organization.pk,
+                depth=organization.depth - index,
+            )
+            for index, ancestor_id in enumerate(ancestors)
+        )
+    OrganizationClosure.objects.using(using).bulk_create(links, batch_size=1000)
+
+
+def reindex_moved_organization(organization, using=None):
+    """
+    Re-links an organization's whole subtree after its parent changed.
+
+    Detaches the subtree from the old ancestors and attaches it below the new
+    parent using a constant number of statements, regardless of subtree size.
+
+    Args:
+        organization (Organization): The organization whose parent changed.
+        using (str): The database alias to write to.
+    """
+
+    using = using or router.db_for_write(Organization, instance=organization)
+    links = OrganizationClosure.objects.using(using)
+    subtree = links.filter(ancestor_id=organization.pk).values("descendant_id")
+    old_ancestors = (
+        links.filter(descendant_id=organization.pk)
+        .exclude(ancestor_id=organization.pk)
+        .values("ancestor_id")
+    )
+    links.filter(descendant_id__in=subtree, ancestor_id__in=old_ancestors).delete()
+    if organization.parent_id:
+        _link_subtree(organization.pk, organization.parent_id, using)
+
+
+def indexed_parent_id(organization, using=None):
+    """
+    Returns the parent id currently recorded in the hierarchy index.
+    """
+
+    using = using or router.db_for_read(Organization, instance=organization)
+    return (
+        OrganizationClosure.objects.using(using)
+        .filter(descendant_id=organization.pk, depth=1)
+        .values_list("ancestor_id", flat=True)
+        .first()
+    )
+
+
+def rebuild_hierarchy_index(using=None):
+    """
+    Rebuilds the whole closure table from the ``parent`` column.
+
+    Reads the adjacency list once and writes the index in batches, so it is
+    suitable for repairing drift or back-filling existing data.
+
+    Returns:
+        int: The number of closure rows written.
+    """
+
+    using = using or router.db_for_write(Organization)
+    parents = dict(
+        Organization.objects.using(using).values_list("pk", "parent_id").iterator()
+    )
+    links = []
+    for organization_id in parents:
+        depth = 0
+        current = organization_id
+        seen = set()
+        while current is not None and current not in seen:
+            seen.add(current)
+            links.append(
+                OrganizationClosure(
+                    ancestor_id=current, descendant_id=organization_id, depth=depth
+                )
+            )
+            current = parents.get(current)
+            depth += 1
+
+    OrganizationClosure.objects.using(using).all().delete()
+    OrganizationClosure.objects.using(using).bulk_create(links, batch_size=1000)
+    return len(links)
+
+
+def rebuild_paths(using=None):
+    """
+    Recomputes the stored path and depth of every organization from the
+    ``parent`` column.
+
+    Returns:
+        int: The number of organizations whose position changed.
+    """
+
+    using = using or router.db_for_write(Organization)
+    rows = list(
+        Organization.objects.using(using).values_list(
+            "pk", "parent_id", "path", "depth"
+        )
+    )
+    parents = {pk: parent_id for pk, parent_id, _, _ in rows}
+    changed = []
+    for pk, parent_id, path, depth in rows:
+        ancestors = []
+        current = parent_id
+        while current is not None and current not in ancestors:
+            ancestors.append(current)
+            current = parents.get(current)
+        new_path = "".join(f"{ancestor}/" for ancestor in reversed(ancestors))
+        if (new_path, len(ancestors)) != (path, depth):
+            changed.append(Organization(pk=pk, path=new_path, depth=len(ancestors)))
+    Organization.objects.using(using).bulk_update(
+        changed, POSITION_FIELDS, batch_size=1000
+    )
+    return len(changed)
@@ -0,0 +1,197 @@
+# organization/services/importer.py
+
+import csv
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import router, transaction
+from django.utils.text import slugify
+
+from ..models.organization import Organization
+
+IMPORT_CHUNK_SIZE = 1000
+
+# Columns read from each row; ``parent`` holds the parent's slug.
+IMPORT_FIELDS = (
+    "name",
+    "slug",
+    "parent",
+    "abbreviation",
+    "description",
+    "max_depth",
+    "is_active",
+)
+
+FALSE_VALUES = {"0", "false", "no", "n", "off"}
+
+
+def read_rows(stream, format="csv"):
+    """
+    Yields ``(line_number, row)`` pairs from a CSV (with a header) or JSON
+    Lines stream, one row at a time.
+    """
+
+    if format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif format == "jsonl":
+        for line_number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield line_number, json.loads(line)
+    else:
+        raise ValueError(f"Unsupported import format: {format}")
+
+
+def import_organizations(rows, chunk_size=IMPORT_CHUNK_SIZE, using=None):
+    """
+    Imports organizations from ``(line_number, row)`` pairs in one transaction.
+
+    Parents are resolved by slug, against existing organizations or rows of
+    the same import in any order. Depth and slug uniqueness are validated in
+    memory, and organizations are inserted with ``bulk_create`` in chunks, so
+    the number of queries does not grow with the number of rows.
+
+    Args:
+        rows (Iterable[tuple]): Line numbers and row mappings, see ``read_rows``.
+        chunk_size (int): Organizations inserted per ``bulk_create`` call.
+        using (str): The database alias to write to.
+
+    Returns:
+        int: The number of organizations created.
+
+    Raises:
+        ValidationError: If a row is invalid; nothing is imported.
+    """
+
+    using = using or router.db_for_write(Organization)
+    with transaction.atomic(using=using):
+        importer = _Importer(using, chunk_size)
+        for line_number, row in rows:
+            importer.add(line_number, row)
+        importer.finish()
+    return importer.created
+
+
+class _Importer:
+    def __init__(self, using, chunk_size):
+        self.using = using
+        self.chunk_size = chunk_size
+        self.created = 0
+        self.buffer = []
+        # slug -> organizations (saved rows as ``(pk, depth)``, imported rows
+        # as instances) that a child row may name as its parent.
+        self.parents = {}
+        self.children = set()
+        # Organization names are unique across the whole table.
+        self.names = set()
+        for pk, parent_id, slug, depth, name in (
+            Organization.objects.using(using)
+            .values_list("pk", "parent_id", "slug", "depth", "name")
+            .iterator()
+        ):
+            self.parents.setdefault(slug, []).append((pk, depth))
+            self.children.add((parent_id, slug))
+            self.names.add(name)
+        self.waiting = {}
+
+    def add(self, line_number, row):
+        name = (row.get("name") or "").strip()
+        if not name:
+            raise ValidationError(f"Line {line_number}: name is required.")
+        if name in self.names:
+            raise ValidationError(
+                f'Line {line_number}: name "{name}" is already used by another '
+                "organization."
+            )
+        self.names.add(name)
+        slug = (row.get("slug") or "").strip() or slugify(name)
+        organization = Organization(
+            name=name,
+            slug=slug,
+            abbreviation=row.get("abbreviation") or None,
+            description=row.get("description") or None,
+            is_active=str(row.get("is_active", True)).strip().lower()
+            not in FALSE_VALUES,
+        )
+        if row.get("max_depth") not in (None, ""):
+            try:
+                organization.max_depth = int(row["max_depth"])
+            except (TypeError, ValueError):
+                raise ValidationError(
+                    f"Line {line_number}: max_depth must be a whole number."
+                )
+        try:
+            organization.clean_fields(exclude=["parent"])
+        except ValidationError as error:
+            problems = "; ".join(
+                f"{field}: {message}"
+                for field, messages in error.message_dict.items()
+                for message in messages
+            )
+            raise ValidationError(f"Line {line_number}: {problems}")
+        organization._import_line = line_number
+
+        parent_slug = (row.get("parent") or "").strip()
+        if parent_slug and parent_slug not in self.parents:
+            self.waiting.setdefault(parent_slug, []).append(organization)
+            return
+        self._place(organization, parent_slug)
+
+    def finish(self):
+        if self.waiting:
+            parent_slug, (organization, *_) = next(iter(self.waiting.items()))
+            raise ValidationError(
+                f'Line {organization._import_line}: parent "{parent_slug}" '
+                "does not exist."
+            )
+        self._flush()
+
+    def _place(self, organization, parent_slug):
+        # Placing an organization can release rows that were waiting for it.
+        pending = [(organization, parent_slug)]
+        while pending:
+            organization, parent_slug = pending.pop()
+            if parent_slug:
+                candidates = self.parents[parent_slug]
+                if len(candidates) > 1:
+                    raise ValidationError(
+                        f"Line {organization._import_line}: parent "
+                        f'"{parent_slug}" is ambiguous.'
+                    )
+                parent = candidates[0]
+                if isinstance(parent, Organization):
+                    organization.parent = parent
+                    parent_key, parent_depth = id(parent), parent.depth
+                else:
+                    organization.parent_id, parent_depth = parent
+                    parent_key = organization.parent_id
+                organization.depth = parent_depth + 1
+            else:
+                parent_key, organization.depth = None, 0
+            self._validate(organization, parent_key)
+            self.children.add((parent_key, organization.slug))
+            self.parents.setdefault(organization.slug, []).append(organization)
+            self.buffer.append(organization)
+            if len(self.buffer) >= self.chunk_size:
+                self._flush()
+            pending.extend(
+                (child, organization.slug)
+                for child in self.waiting.pop(organization.slug, ())
+            )
+
+    def _validate(self, organization, parent_key):
+        line = organization._import_line
+        if organization.depth > organization.max_depth:
+            raise ValidationError(f"Line {line}: Maximum hierarchy depth exceeded")
+        if (parent_key, organization.slug) in self.children:
+            raise ValidationError(
+                f'Line {line}: slug "{organization.slug}" is already used under '
+                "this parent."
+            )
+
+    def _flush(self):
+        if self.buffer:
+            Organization.objects.using(self.using).bulk_create(self.buffer)
+            self.created += len(self.buffer)
+            self.buffer = []
@@ -0,0 +1,226 @@
+# organization/services/labels.py
+
+import functools
+import logging
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+from ..models.organization import DEFAULT_LABELS, Organization, OrganizationLabels
+from .tree import bump_tree_version, get_tree
+
+logger = logging.getLogger(__name__)
+
+LABELS_CACHE_TIMEOUT = 3600  # 1 hour
+
+PLURAL_EXCEPTIONS = {
+    "quarters_label": "Quarters",
+    "faculty_label": "Faculty",
+}
+
+PLURAL_CACHE_SIZE = 2048
+
+# Reverse one-to-one accessors from the user model to its profiles, in lookup
+# order. Names that do not exist on the installed user model are ignored.
+PROFILE_RELATIONS = (
+    "attendeeprofile_profile",
+    "leaderprofile_profile",
+    "facultyprofile_profile",
+    "attendeeprofile",
+    "leaderprofile",
+    "facultyprofile",
+)
+
+
+def user_organization_cache_key(user_id):
+    return f"organization_labels_user:{user_id}"
+
+
+def get_user_organization_id(user):
+    """
+    Returns the id of the organization the user's profile belongs to, or None.
+
+    The user → organization mapping is a small cache entry, so label lookups do
+    not probe profiles on every request.
+    """
+
+    if user is None or user.pk is None:
+        return None
+    cache_key = user_organization_cache_key(user.pk)
+    organization_id = cache.get(cache_key)
+    if organization_id is None:
+        profile = find_user_profile(user)
+        organization_id = getattr(profile, "organization_id", None) or 0
+        cache.set(cache_key, organization_id, timeout=LABELS_CACHE_TIMEOUT)
+    return organization_id or None
+
+
+def find_user_profile(user):
+    """
+    Returns the user's attendee, leader or faculty profile, or None.
+
+    Loads the user with every profile relation joined in, so finding the
+    profile costs one query whichever type the user has.
+    """
+
+    relations = profile_relations()
+    if not relations or user.pk is None:
+        return None
+    user = (
+        get_user_model()
+        ._default_manager.select_related(*relations)
+        .filter(pk=user.pk)
+        .first()
+    )
+    for relation in relations:
+        # A missing reverse one-to-one raises an AttributeError subclass.
+        profile = getattr(user, relation, None)
+        if profile is not None:
+            return profile
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def profile_relations():
+    accessors = {
+        relation.get_accessor_name()
+        for relation in get_user_model()._meta.related_objects
+        if relation.one_to_one
+    }
+    return tuple(name for name in PROFILE_RELATIONS if name in accessors)
+
+
+def get_user_labels(user):
+    """
+    Returns the label bundle (singular and plural) for the user's organization,
+    shared by every user of that organization.
+    """
+
+    organization_id = get_user_organization_id(user)
+    if organization_id is None:
+        logger.debug("Using default organization labels; no profile found for user.")
+    return get_labels(organization_id)
+
+
+def get_labels(organization_id):
+    """
+    Returns the label bundle for an organization, building it on a miss.
+
+    Bundles are memoized on the tree snapshot per label source, the nearest
+    organization at or above that overrides labels, so every organization
+    inheriting the same overrides shares one bundle.
+
+    Args:
+        organization_id (int | None): The organization id, or None for the defaults.
+
+    Returns:
+        dict: Singular labels plus their ``<key>_plural`` forms.
+    """
+
+    if organization_id is None:
+        return default_labels()
+    tree = get_tree()
+    source = (
+        tree.label_source(organization_id)
+        if organization_id in tree
+        else organization_id
+    )
+    if source is None:
+        return default_labels()
+    bundles = tree.derived.setdefault("labels", {})
+    labels = bundles.get(source)
+    if labels is None:
+        labels = bundles[source] = build_labels(source)
+    return labels
+
+
+@functools.lru_cache(maxsize=None)
+def default_labels():
+    """
+    Returns the label bundle of organizations that override nothing, built
+    once per process.
+    """
+    return build_labels(None)
+
+
+def build_labels(organization_id):
+    """
+    Merges the label overrides of an organization's ancestors, root first,
+    over the defaults in a single query.
+    """
+
+    labels = dict(DEFAULT_LABELS)
+    if organization_id:
+        ancestors = Organization.objects.filter(pk=organization_id).with_ancestors()
+        chain = (
+            OrganizationLabels.objects.filter(organization__in=ancestors)
+            .order_by("organization__depth")
+            .values_list("overrides", flat=True)
+        )
+        for overrides in chain:
+            labels.update(merge_overrides(overrides))
+    return add_pluralized_labels(labels, PLURAL_EXCEPTIONS)
+
+
+def merge_overrides(overrides):
+    """
+    Returns the stored overrides that name a known label, ignoring blanks.
+    """
+    return {
+        key: value
+        for key, value in overrides.items()
+        if key in DEFAULT_LABELS and value
+    }
+
+
+def invalidate_organization_labels(organization_id, using=None):
+    """
+    Drops the label bundles of an organization and of every organization below
+    it, which inherit its labels, by moving the tree snapshot on.
+    """
+
+    bump_tree_version(using)
+
+
+def add_pluralized_labels(labels, plural_exceptions):
+    """
+    Adds pluralized versions of the labels to the dictionary.
+
+    Args:
+        labels (dict): A dictionary of singular labels.
+        plural_exceptions (dict): A dictionary of labels with predefined plural forms.
+
+    Returns:
+        dict: Updated dictionary with pluralized labels.
+    """
+    pluralized_labels = {}
+
+    for key, value in labels.items():
+        if key in plural_exceptions:
+            # Use the exception-defined plural form
+            pluralized_labels[f"{key}_plural"] = plural_exceptions[key]
+        else:
+            # Generate the plural form dynamically
+            pluralized_labels[f"{key}_plural"] = pluralize(value)
+
+    labels.update(pluralized_labels)
+    return labels
+
+
+@functools.lru_cache(maxsize=PLURAL_CACHE_SIZE)
+def pluralize(text):
+    """
+    Returns the plural form of a label, memoized per process.
+
+    Label texts repeat across every organization, so each distinct text is
+    inflected once instead of on every cache miss.
+    """
+    return _inflector().plural(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _inflector():
+    # inflect is slow to import and to construct; defer both to first use.
+    import inflect
+
+    return inflect.engine()
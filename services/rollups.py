@@ -0,0 +1,240 @@
+# organization/services/rollups.py
+
+import threading
+from contextlib import contextmanager
+
+from django.db import router, transaction
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Greatest
+
+from ..conf import rollup_counters_enabled
+from ..models.organization import Organization
+from ..querysets.organization import ROLLUP_RELATIONS
+from .versions import advance_version, get_version
+
+ROLLUP_VERSION_KEY = "organization_rollup_version"
+
+# Organizations currently being deleted; rows cascading away with them must not
+# adjust counters a second time.
+_deleting = threading.local()
+
+# The stored organization of a related row whose foreign key was deferred.
+_UNKNOWN = object()
+
+
+def _deleting_ids():
+    if not hasattr(_deleting, "ids"):
+        _deleting.ids = set()
+    return _deleting.ids
+
+
+@contextmanager
+def tracking_deletes():
+    """
+    Forgets the organizations registered as being deleted inside the block
+    when it exits, so a delete that fails between pre_delete and post_delete
+    does not keep suppressing counter updates on this thread.
+    """
+
+    ids = _deleting_ids()
+    before = set(ids)
+    try:
+        yield
+    finally:
+        ids.intersection_update(before)
+
+
+def _ancestry(organization_id, using):
+    return Organization.objects.using(using).filter(pk=organization_id).with_ancestors()
+
+
+def _shifted(field, delta):
+    # Counters are unsigned; rows added without signals (bulk_create,
+    # QuerySet.update) leave them low until recomputed, so never go below 0.
+    if delta >= 0:
+        return F(field) + delta
+    return Greatest(F(field) + delta, Value(0), output_field=IntegerField())
+
+
+def get_rollup_version():
+    """
+    Returns the shared version of the cached counters, in milliseconds.
+    """
+    return get_version(ROLLUP_VERSION_KEY)
+
+
+def bump_rollup_version(using=None):
+    """
+    Marks the cached counters as changed once the surrounding transaction
+    commits, for clients revalidating responses that include them.
+    """
+    transaction.on_commit(lambda: advance_version(ROLLUP_VERSION_KEY), using=using)
+
+
+def adjust_rollups(organization_id, relation, delta, using=None):
+    """
+    Applies a change in the number of related rows to an organization's direct
+    counter and to the subtree counters of the organization and its ancestors,
+    in a single UPDATE.
+
+    Args:
+        organization_id (int): The organization the related rows belong to.
+        relation (str): The reverse relation name, e.g. ``"factions"``.
+        delta (int): The change in the number of related rows.
+        using (str): The database alias to write to.
+    """
+
+    if not organization_id or not delta or not rollup_counters_enabled():
+        return
+    using = using or router.db_for_write(Organization)
+    direct = f"{relation}_count"
+    subtree = f"subtree_{relation}_count"
+    _ancestry(organization_id, using).update(
+        **{
+            direct: Case(
+                When(pk=organization_id, then=_shifted(direct, delta)),
+                default=F(direct),
+                output_field=IntegerField(),
+            ),
+            subtree: _shifted(subtree, delta),
+        }
+    )
+    bump_rollup_version(using)
+
+
+def move_subtree_totals(organization, previous_parent_id, using=None):
+    """
+    Moves an organization's subtree totals from its old ancestors to its new
+    ones after a re-parent.
+
+    Args:
+        organization (Organization): The organization whose parent changed.
+        previous_parent_id (int | None): The parent before the change.
+        using (str): The database alias to write to.
+    """
+
+    if not rollup_counters_enabled():
+        return
+    using = using or router.db_for_write(Organization, instance=organization)
+    fields = [f"subtree_{relation}_count" for relation in ROLLUP_RELATIONS]
+    totals = (
+        Organization.objects.using(using)
+        .filter(pk=organization.pk)
+        .values(*fields)
+        .first()
+    )
+    if not totals or not any(totals.values()):
+        return
+    if previous_parent_id:
+        _ancestry(previous_parent_id, using).update(
+            **{field: _shifted(field, -totals[field]) for field in fields}
+        )
+    if organization.parent_id:
+        _ancestry(organization.parent_id, using).update(
+            **{field: F(field) + totals[field] for field in fields}
+        )
+    bump_rollup_version(using)
+
+
+def connect_rollup_signals():
+    """
+    Connects counter maintenance to every related model listed in
+    ``ROLLUP_RELATIONS``. Called from ``OrganizationConfig.ready()``.
+    """
+
+    from django.db.models.signals import (
+        post_delete,
+        post_init,
+        post_save,
+        pre_delete,
+        pre_save,
+    )
+
+    for relation in ROLLUP_RELATIONS:
+        related = Organization._meta.get_field(relation)
+        handlers = _RelatedRollupHandlers(relation, related.field)
+        options = {
+            "sender": related.related_model,
+            "weak": False,
+            "dispatch_uid": f"organization_rollups_{relation}",
+        }
+        post_init.connect(handlers.remember, **options)
+        pre_save.connect(handlers.saving, **options)
+        post_save.connect(handlers.saved, **options)
+        post_delete.connect(handlers.deleted, **options)
+
+    pre_delete.connect(
+        _organization_deleting, sender=Organization, dispatch_uid="organization_rollups"
+    )
+    post_delete.connect(
+        _organization_deleted, sender=Organization, dispatch_uid="organization_rollups"
+    )
+
+
+class _RelatedRollupHandlers:
+    def __init__(self, relation, field):
+        self.relation = relation
+        self.name = field.name
+        self.attname = field.attname
+
+    def remember(self, sender, instance, **kwargs):
+        # A deferred foreign key is unknown until read from the database.
+        instance._rollup_organization_id = instance.__dict__.get(
+            self.attname, _UNKNOWN
+        )
+
+    def writes(self, update_fields):
+        return update_fields is None or self.name in update_fields
+
+    def saving(self, sender, instance, raw, using, update_fields, **kwargs):
+        if instance._state.adding or not self.writes(update_fields):
+            return
+        if getattr(instance, "_rollup_organization_id", _UNKNOWN) is _UNKNOWN:
+            instance._rollup_organization_id = (
+                sender._base_manager.using(using)
+                .filter(pk=instance.pk)
+                .values_list(self.attname, flat=True)
+                .first()
+            )
+
+    def saved(self, sender, instance, created, using, update_fields, **kwargs):
+        if not created and not self.writes(update_fields):
+            return
+        current = getattr(instance, self.attname)
+        previous = None if created else instance._rollup_organization_id
+        if current != previous:
+            adjust_rollups(previous, self.relation, -1, using=using)
+            adjust_rollups(current, self.relation, 1, using=using)
+        instance._rollup_organization_id = current
+
+    def deleted(self, sender, instance, using, **kwargs):
+        organization_id = getattr(instance, self.attname)
+        if organization_id not in _deleting_ids():
+            adjust_rollups(organization_id, self.relation, -1, using=using)
+
+
+def _organization_deleting(sender, instance, using, **kwargs):
+    # Every deleted organization (including cascaded children) removes its own
+    # direct counts from its ancestors, which adds up to the whole subtree.
+    _deleting_ids().add(instance.pk)
+    if not rollup_counters_enabled() or not instance.parent_id:
+        return
+    counts = (
+        Organization.objects.using(using)
+        .filter(pk=instance.pk)
+        .values(*(f"{relation}_count" for relation in ROLLUP_RELATIONS))
+        .first()
+    )
+    if counts and any(counts.values()):
+        _ancestry(instance.parent_id, using).update(
+            **{
+                f"subtree_{relation}_count": _shifted(
+                    f"subtree_{relation}_count", -counts[f"{relation}_count"]
+                )
+                for relation in ROLLUP_RELATIONS
+            }
+        )
+
+
+def _organization_deleted(sender, instance, **kwargs):
+    _deleting_ids().discard(instance.pk)
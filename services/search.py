@@ -0,0 +1,195 @@
+# organization/services/search.py
+
+import re
+import unicodedata
+
+from django.db import router, transaction
+from django.db.models import F, FilteredRelation, FloatField, Q, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from ..conf import hierarchy_index_enabled, search_backend
+from ..models.organization import SEARCH_FIELDS, Organization, OrganizationSearchTerm
+
+# How much a match in each field counts towards the rank; a whole-word match
+# counts double.
+SEARCH_FIELD_WEIGHTS = {"name": 4, "abbreviation": 3, "description": 1}
+# Fields indexed by word prefix for typeahead; the others by whole word only.
+PREFIX_FIELDS = ("name", "abbreviation")
+MIN_PREFIX_LENGTH = 2
+SEARCH_TERM_LENGTH = OrganizationSearchTerm._meta.get_field("term").max_length
+SEARCH_INDEX_BATCH_SIZE = 5000
+# Index entries counted per word, at most, to find the rarest word of a query.
+SELECTIVITY_SAMPLE = 10000
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_words(text):
+    """
+    Returns the casefolded, accent-free words of ``text``, cut to the indexed
+    term length.
+    """
+
+    if not text:
+        return []
+    text = str(text)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(char for char in text if not unicodedata.combining(char))
+    return [word[:SEARCH_TERM_LENGTH] for word in _WORD.findall(text.casefold())]
+
+
+def organization_terms(name, abbreviation, description):
+    """
+    Returns the weighted search terms of an organization's text: every prefix
+    of at least ``MIN_PREFIX_LENGTH`` characters of its name and abbreviation
+    words, and the whole words of its description.
+
+    Returns:
+        dict: The highest weight of each term, keyed by term.
+    """
+
+    terms = {}
+    for field, text in zip(SEARCH_FIELDS, (name, abbreviation, description)):
+        weight = SEARCH_FIELD_WEIGHTS[field]
+        for word in normalize_words(text):
+            shortest = MIN_PREFIX_LENGTH if field in PREFIX_FIELDS else len(word)
+            for length in range(min(shortest, len(word)), len(word) + 1):
+                term = word[:length]
+                term_weight = weight * 2 if length == len(word) else weight
+                if terms.get(term, 0) < term_weight:
+                    terms[term] = term_weight
+    return terms
+
+
+def index_organizations(organizations, using=None, replace=True):
+    """
+    Writes the search terms of saved organizations, replacing their previous
+    terms unless ``replace`` is False (freshly inserted organizations).
+    """
+
+    organizations = list(organizations)
+    using = using or router.db_for_write(OrganizationSearchTerm)
+    terms = OrganizationSearchTerm.objects.using(using)
+    with transaction.atomic(using=using, savepoint=False):
+        if replace:
+            for organization in organizations:
+                deferred = organization.get_deferred_fields() & set(SEARCH_FIELDS)
+                if deferred:
+                    organization.refresh_from_db(using=using, fields=deferred)
+            terms.filter(
+                organization_id__in=[organization.pk for organization in organizations]
+            ).delete()
+        terms.bulk_create(
+            [
+                OrganizationSearchTerm(
+                    organization_id=organization.pk, term=term, weight=weight
+                )
+                for organization in organizations
+                for term, weight in organization_terms(
+                    *organization.search_text()
+                ).items()
+            ],
+            batch_size=SEARCH_INDEX_BATCH_SIZE,
+        )
+
+
+def rebuild_search_index(using=None):
+    """
+    Rebuilds the search terms of every organization from scratch.
+
+    Returns:
+        int: The number of organizations indexed.
+    """
+
+    using = using or router.db_for_write(OrganizationSearchTerm)
+    indexed = 0
+    with transaction.atomic(using=using):
+        OrganizationSearchTerm.objects.using(using).all().delete()
+        batch = []
+        organizations = Organization.objects.using(using).only(*SEARCH_FIELDS)
+        for organization in organizations.iterator(chunk_size=SEARCH_INDEX_BATCH_SIZE):
+            batch.append(organization)
+            if len(batch) == SEARCH_INDEX_BATCH_SIZE:
+                index_organizations(batch, using=using, replace=False)
+                indexed += len(batch)
+                batch = []
+        index_organizations(batch, using=using, replace=False)
+        indexed += len(batch)
+    return indexed
+
+
+def search_organizations(query, queryset=None, within=None):
+    """
+    Returns the organizations matching ``query``, best match first, annotated
+    with ``search_rank``.
+
+    With the ``"terms"`` backend every word of the query must match: name and
+    abbreviation words by prefix, description words whole. Query words shorter
+    than ``MIN_PREFIX_LENGTH`` only match whole words. With ``"trigram"`` the
+    query is matched by trigram word similarity instead.
+
+    Args:
+        query (str): The text typed by the user.
+        queryset (QuerySet | None): Organizations to search, all by default.
+        within (Organization | int | None): Only search this subtree.
+    """
+
+    if queryset is None:
+        queryset = Organization.objects.all()
+    if within is not None:
+        root_id = getattr(within, "pk", within)
+        if hierarchy_index_enabled():
+            queryset = queryset.descendants_of(root_id)
+        else:
+            subtree = Organization.objects.filter(pk=root_id).with_descendants()
+            queryset = queryset.filter(pk__in=subtree.values("pk"))
+    words = list(dict.fromkeys(normalize_words(query)))
+    if not words:
+        return queryset.none()
+    if search_backend(queryset.db) == "trigram":
+        return _trigram_search(queryset, " ".join(words))
+    # One inner join per word on the (term, organization) index, rarest word
+    # first so it drives the join.
+    rank = Value(0)
+    for index, word in enumerate(_rarest_first(words, queryset.db)):
+        alias = f"search_term_{index}"
+        queryset = queryset.alias(
+            **{
+                alias: FilteredRelation(
+                    "search_terms", condition=Q(search_terms__term=word)
+                )
+            }
+        ).filter(**{f"{alias}__isnull": False})
+        rank += F(f"{alias}__weight")
+    return queryset.annotate(search_rank=rank).order_by("-search_rank", "name", "pk")
+
+
+def _rarest_first(words, using):
+    if len(words) < 2:
+        return words
+    terms = OrganizationSearchTerm.objects.using(using)
+    return sorted(
+        words, key=lambda word: terms.filter(term=word)[:SELECTIVITY_SAMPLE].count()
+    )
+
+
+def _trigram_search(queryset, query):
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    # "%>" is served by the gin_trgm_ops indexes of Organization.Meta.
+    matches = Q()
+    for field in SEARCH_FIELDS:
+        matches |= Q(**{f"{field}__trigram_word_similar": query})
+    rank = Greatest(
+        *(
+            Coalesce(TrigramWordSimilarity(query, field), Value(0.0)) * weight
+            for field, weight in SEARCH_FIELD_WEIGHTS.items()
+        ),
+        output_field=FloatField(),
+    )
+    return (
+        queryset.filter(matches)
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "name", "pk")
+    )
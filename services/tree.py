@@ -0,0 +1,247 @@
+# organization/services/tree.py
+
+import threading
+
+from django.db import connections, router, transaction
+from django.db.models import Exists, OuterRef
+
+from ..models.organization import Organization, OrganizationLabels
+from .versions import advance_version, get_version
+
+TREE_VERSION_KEY = "organization_tree_version"
+
+_lock = threading.Lock()
+_snapshot = None
+
+
+class OrganizationTree:
+    """
+    Immutable in-memory snapshot of the organization hierarchy.
+
+    Holds parent and children ids keyed by organization id, ids keyed by slug
+    and the ids of organizations that override labels, so ancestor,
+    descendant, root, slug and label source lookups run without touching the
+    database. Indexes derived from the snapshot (e.g. autocomplete) are
+    memoized in ``derived`` and go away with it.
+    """
+
+    __slots__ = (
+        "version",
+        "using",
+        "derived",
+        "parents",
+        "children",
+        "slugs",
+        "child_slugs",
+        "labelled",
+    )
+
+    def __init__(self, version, rows, using=None):
+        self.version = version
+        self.using = using
+        self.derived = {}
+        self.parents = {}
+        children = {}
+        slugs = {}
+        self.child_slugs = {}
+        labelled = set()
+        for pk, parent_id, slug, overrides_labels in rows:
+            self.parents[pk] = parent_id
+            if overrides_labels:
+                labelled.add(pk)
+            if parent_id is not None:
+                children.setdefault(parent_id, []).append(pk)
+            slugs.setdefault(slug, []).append(pk)
+            self.child_slugs[(parent_id, slug)] = pk
+        self.children = {pk: tuple(ids) for pk, ids in children.items()}
+        self.slugs = {slug: tuple(ids) for slug, ids in slugs.items()}
+        self.labelled = frozenset(labelled)
+
+    def __contains__(self, pk):
+        return pk in self.parents
+
+    def __len__(self):
+        return len(self.parents)
+
+    def parent_of(self, pk):
+        return self.parents.get(pk)
+
+    def children_of(self, pk):
+        return self.children.get(pk, ())
+
+    def ancestors(self, pk, include_self=False):
+        """
+        Returns the ids above an organization, nearest first.
+        """
+
+        ancestors = [pk] if include_self else []
+        current = self.parents.get(pk)
+        while current is not None and current not in ancestors:
+            ancestors.append(current)
+            current = self.parents.get(current)
+        return ancestors
+
+    def root_of(self, pk):
+        """
+        Returns the id of the top-level organization above ``pk`` (or ``pk``
+        itself for a root), or None for an unknown id.
+        """
+
+        if pk not in self.parents:
+            return None
+        ancestors = self.ancestors(pk, include_self=True)
+        return ancestors[-1]
+
+    def label_source(self, pk):
+        """
+        Returns the id of the nearest organization at or above ``pk`` that
+        overrides labels, or None when ``pk`` inherits the defaults.
+        """
+
+        for ancestor in self.ancestors(pk, include_self=True):
+            if ancestor in self.labelled:
+                return ancestor
+        return None
+
+    def resolve_slug(self, slug):
+        """
+        Returns the id of the only organization with ``slug``, or None when no
+        organization or more than one (under different parents) has it.
+        """
+
+        ids = self.slugs.get(slug, ())
+        return ids[0] if len(ids) == 1 else None
+
+    def resolve_path(self, path):
+        """
+        Returns the id at a slug path from a root, e.g.
+        ``"council/district/unit"``, or None when the path does not exist.
+        """
+
+        pk = None
+        for slug in path.strip("/").split("/"):
+            pk = self.child_slugs.get((pk, slug))
+            if pk is None:
+                return None
+        return pk
+
+    def descendants(self, pk, include_self=False):
+        """
+        Returns the ids below an organization in breadth-first order.
+        """
+
+        descendants = [pk] if include_self else []
+        frontier = [pk]
+        seen = {pk}
+        while frontier:
+            level = []
+            for parent_id in frontier:
+                for child_id in self.children.get(parent_id, ()):
+                    if child_id not in seen:
+                        seen.add(child_id)
+                        level.append(child_id)
+            descendants.extend(level)
+            frontier = level
+        return descendants
+
+
+def get_tree_version():
+    """
+    Returns the shared tree version: the time, in milliseconds, of the last
+    committed organization save or delete, or label change.
+    """
+
+    return get_version(TREE_VERSION_KEY)
+
+
+def bump_tree_version(using=None):
+    """
+    Invalidates every process's tree snapshot once the surrounding
+    transaction commits, so no process rebuilds from uncommitted data.
+
+    Until then, ``get_tree()`` inside the writing transaction answers from a
+    snapshot private to that transaction.
+    """
+
+    transaction.on_commit(_incr_tree_version, using=using)
+
+
+def _incr_tree_version():
+    global _snapshot
+    _snapshot = None
+    advance_version(TREE_VERSION_KEY)
+
+
+def _pending_bumps(connection):
+    # Bumps registered in the current transaction and not rolled back, keyed
+    # by the savepoints they were registered under.
+    if not connection.in_atomic_block:
+        return ()
+    return tuple(
+        tuple(sorted(savepoints))
+        for savepoints, callback, *_ in connection.run_on_commit
+        if callback is _incr_tree_version
+    )
+
+
+def _load_tree(version, using):
+    overrides = OrganizationLabels.objects.filter(organization=OuterRef("pk")).exclude(
+        overrides={}
+    )
+    rows = (
+        Organization.objects.using(using)
+        .annotate(overrides_labels=Exists(overrides))
+        .values_list("pk", "parent_id", "slug", "overrides_labels")
+    )
+    return OrganizationTree(version, rows.iterator(), using=using)
+
+
+def get_tree():
+    """
+    Returns the process-local tree snapshot, reloading it when the shared
+    version has moved on. Costs one cache read when the snapshot is current.
+
+    Inside a transaction that changed organizations, returns a snapshot of
+    its uncommitted state instead, which is never shared with other threads.
+    """
+
+    global _snapshot
+    version = get_tree_version()
+    using = router.db_for_write(Organization)
+    connection = connections[using]
+    pending = _pending_bumps(connection)
+    if pending:
+        private = getattr(connection, "_organization_tree", None)
+        if private is None or private[0] != pending:
+            private = (pending, _load_tree(version, using))
+            connection._organization_tree = private
+        return private[1]
+    tree = _snapshot
+    if tree is not None and tree.version == version:
+        return tree
+    with _lock:
+        tree = _snapshot
+        if tree is None or tree.version != version:
+            tree = _load_tree(version, router.db_for_read(Organization))
+            _snapshot = tree
+    return tree
+
+
+def root_of(pk):
+    return get_tree().root_of(pk)
+
+
+def ancestors(pk, include_self=False):
+    return get_tree().ancestors(pk, include_self=include_self)
+
+
+def descendants(pk, include_self=False):
+    return get_tree().descendants(pk, include_self=include_self)
+
+
+def resolve_slug(slug):
+    return get_tree().resolve_slug(slug)
+
+
+def resolve_path(path):
+    return get_tree().resolve_path(path)
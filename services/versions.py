@@ -0,0 +1,41 @@
+# organization/services/versions.py
+
+import time
+
+from django.core.cache import cache
+
+
+def _now():
+    return int(time.time() * 1000)
+
+
+def get_version(key):
+    """
+    Returns a shared data version, initialising it when the cache is cold.
+
+    Versions are millisecond timestamps of the last change, so they double as
+    ``Last-Modified`` values; a flushed cache restarts at the current time and
+    never hands out a version an older reader may still hold.
+    """
+
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _now(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def advance_version(key):
+    """
+    Moves a shared version forward to the current time, or by one when the
+    clock has not moved past it.
+    """
+
+    current = cache.get(key)
+    if current is None:
+        cache.add(key, _now(), timeout=None)
+        return
+    try:
+        cache.incr(key, max(1, _now() - current))
+    except ValueError:
+        cache.add(key, _now(), timeout=None)
@@ -0,0 +1,59 @@
+// organization/static/organization/js/autocomplete.js
+// Fills <select data-autocomplete-url> pickers from the autocomplete endpoint.
+
+(function () {
+    "use strict";
+
+    function attach(select) {
+        if (select.dataset.autocompleteAttached) {
+            return;
+        }
+        select.dataset.autocompleteAttached = "true";
+
+        var input = document.createElement("input");
+        input.type = "search";
+        input.className = select.className;
+        input.placeholder = "Search organizations";
+        input.setAttribute("aria-label", "Search organizations");
+        select.parentNode.insertBefore(input, select);
+
+        var timer = null;
+        var pending = null;
+        input.addEventListener("input", function () {
+            clearTimeout(timer);
+            timer = setTimeout(function () {
+                var query = input.value.trim();
+                if (!query) {
+                    return;
+                }
+                if (pending) {
+                    pending.abort();
+                }
+                pending = new AbortController();
+                var url = select.dataset.autocompleteUrl + "?q=" + encodeURIComponent(query);
+                fetch(url, { signal: pending.signal, headers: { Accept: "application/json" } })
+                    .then(function (response) { return response.json(); })
+                    .then(function (data) { fill(select, data.results); })
+                    .catch(function () {});
+            }, 150);
+        });
+    }
+
+    function fill(select, results) {
+        var selected = select.value;
+        Array.prototype.slice.call(select.options).forEach(function (option) {
+            if (option.value && option.value !== selected) {
+                option.remove();
+            }
+        });
+        results.forEach(function (result) {
+            if (String(result.id) !== selected) {
+                select.add(new Option(result.path, result.id));
+            }
+        });
+    }
+
+    document.addEventListener("DOMContentLoaded", function () {
+        document.querySelectorAll("select[data-autocomplete-url]").forEach(attach);
+    });
+})();
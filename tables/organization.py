@@ -10,6 +10,11 @@ class OrganizationTable(BaseTable):
     available_actions = ["show", "edit", "delete"]
     url_namespace = ""  # explicit names below
 
+    # Subtree rollups; expects a queryset annotated with with_subtree_counts().
+    total_factions_count = tables.Column(verbose_name="Factions", default=0)
+    total_facilities_count = tables.Column(verbose_name="Facilities", default=0)
+    total_attendees_count = tables.Column(verbose_name="Attendees", default=0)
+
     class Meta:
         model = Organization
         template_name = "django_tables2/bootstrap4.html"
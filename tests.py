@@ -1,10 +1,34 @@
-from django.test import RequestFactory
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.db.models.signals import pre_delete
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.core.exceptions import ValidationError
 
+from rest_framework.test import APIRequestFactory, force_authenticate
+
 from core.tests import BaseDomainTestCase
-from organization.models import Organization
-from organization.forms.organization import OrganizationForm
-from organization.views.organization import ListView
+from organization.models import Organization, OrganizationLabels
+from organization.querysets.organization import ROLLUP_RELATIONS
+from organization.context_processors import fetch_labels, organization_labels
+from organization.forms.organization import OrganizationForm, OrganizationLabelsForm
+from organization.selectors import get_organization_by_slug
+from organization.services import autocomplete, labels as label_service, tree
+from organization.services.importer import import_organizations, read_rows
+from organization.utils import get_user_organization_labels
+from organization.views.organization import (
+    AutocompleteView,
+    DetailView,
+    ListView,
+    OrganizationViewSet,
+)
 
 
 class OrganizationModelTests(BaseDomainTestCase):
@@ -27,6 +51,254 @@ class OrganizationModelTests(BaseDomainTestCase):
     def test_root_lookup_traverses_parents(self):
         self.assertEqual(self.organization.get_root_organization(), self.parent_org)
 
+    def test_hierarchy_index_resolves_subtree_and_ancestors(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit",
+            abbreviation="CU",
+            parent=self.organization,
+            max_depth=5,
+        )
+
+        self.assertCountEqual(
+            Organization.objects.descendants_of(self.parent_org),
+            [self.parent_org, self.organization, unit],
+        )
+        self.assertCountEqual(
+            Organization.objects.ancestors_of(unit, include_self=False),
+            [self.parent_org, self.organization],
+        )
+        self.assertEqual(unit.get_fallback_chain(), [self.organization, self.parent_org])
+
+    def test_hierarchy_index_follows_reparenting(self):
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        unit = Organization.objects.create(
+            name="Cedar Unit",
+            abbreviation="CU",
+            parent=self.organization,
+            max_depth=5,
+        )
+
+        self.organization.parent = other_root
+        self.organization.save()
+
+        self.assertEqual(unit.get_root_organization(), other_root)
+        self.assertEqual(
+            list(Organization.objects.descendants_of(self.parent_org)),
+            [self.parent_org],
+        )
+        self.assertIn(unit.pk, other_root.get_descendant_ids())
+
+    def test_recursive_subtree_queries_run_in_one_query(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit",
+            abbreviation="CU",
+            parent=self.organization,
+            max_depth=5,
+        )
+        roots = Organization.objects.filter(pk=self.parent_org.pk)
+
+        with self.assertNumQueries(1):
+            subtree = list(roots.with_descendants())
+        self.assertCountEqual(subtree, [self.parent_org, self.organization, unit])
+
+        with self.assertNumQueries(1):
+            ancestry = list(Organization.objects.filter(pk=unit.pk).with_ancestors())
+        self.assertCountEqual(ancestry, [self.parent_org, self.organization, unit])
+
+    @override_settings(ORGANIZATION_HIERARCHY_INDEX=False)
+    def test_hierarchy_helpers_without_index(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit",
+            abbreviation="CU",
+            parent=self.organization,
+            max_depth=5,
+        )
+
+        self.assertEqual(unit.get_root_organization(), self.parent_org)
+        self.assertEqual(unit.get_fallback_chain(), [self.organization, self.parent_org])
+        self.assertEqual(
+            self.parent_org.get_descendant_ids()[0], self.parent_org.pk
+        )
+        self.assertIn(unit.pk, self.parent_org.get_descendant_ids())
+
+    def test_all_factions_query_count_is_flat(self):
+        def build_tree(prefix, size):
+            parents = [self.organization]
+            for index in range(size):
+                parents.append(
+                    Organization.objects.create(
+                        name=f"{prefix} {index}",
+                        parent=parents[index // 3],
+                        max_depth=size,
+                    )
+                )
+            return Organization.objects.filter(name__startswith=prefix)
+
+        small = build_tree("Small Unit", 5)
+        large = build_tree("Large Unit", 40)
+
+        with self.assertNumQueries(1):
+            list(small.with_all_factions())
+        with self.assertNumQueries(1):
+            list(large.with_all_factions())
+
+    def test_subtree_counts_annotation(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit",
+            abbreviation="CU",
+            parent=self.organization,
+            max_depth=5,
+        )
+        expected = {
+            org.pk: org.get_total_factions_count()
+            for org in (self.parent_org, self.organization, unit)
+        }
+
+        with self.assertNumQueries(1):
+            annotated = {
+                org.pk: org.total_factions_count
+                for org in Organization.objects.filter(
+                    pk__in=expected
+                ).with_subtree_counts()
+            }
+        self.assertEqual(annotated, expected)
+
+        with override_settings(ORGANIZATION_HIERARCHY_INDEX=False):
+            annotated = dict(
+                Organization.objects.filter(pk__in=expected)
+                .with_total_factions_count()
+                .values_list("pk", "total_factions_count")
+            )
+        self.assertEqual(annotated, expected)
+
+    def test_rollup_counters_survive_saves_and_recompute(self):
+        Organization.objects.filter(pk=self.parent_org.pk).update(
+            subtree_factions_count=7
+        )
+        self.parent_org.description = "Edited"
+        self.parent_org.save()
+        self.parent_org.refresh_from_db()
+        self.assertEqual(self.parent_org.subtree_factions_count, 7)
+
+        call_command("recompute_rollups", stdout=StringIO())
+
+        self.parent_org.refresh_from_db()
+        self.assertEqual(
+            self.parent_org.subtree_factions_count,
+            self.parent_org.get_total_factions_count(),
+        )
+
+    def test_clean_resolves_ancestors_in_one_query(self):
+        unit = Organization(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+        with self.assertNumQueries(1):
+            unit.clean()
+
+        unit.max_depth = 1
+        with self.assertRaises(ValidationError):
+            unit.clean()
+
+    def test_clean_rejects_cycles(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+        self.parent_org.parent = unit
+        self.parent_org.max_depth = 10
+        with self.assertRaises(ValidationError):
+            self.parent_org.save()
+
+        self.organization.parent = self.organization
+        with self.assertRaises(ValidationError):
+            self.organization.clean()
+
+    def test_move_subtree_rewrites_paths_and_depths(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        middle = Organization.objects.create(
+            name="Other District", abbreviation="OD", parent=other_root, max_depth=5
+        )
+
+        self.organization.move_subtree(middle)
+
+        unit.refresh_from_db()
+        self.assertEqual(self.organization.depth, 2)
+        self.assertEqual(unit.depth, 3)
+        self.assertEqual(
+            unit.path, f"{other_root.pk}/{middle.pk}/{self.organization.pk}/"
+        )
+        self.assertEqual(unit.get_root_organization(), other_root)
+
+    def test_move_subtree_validates_descendant_depth_up_front(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=2
+        )
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        middle = Organization.objects.create(
+            name="Other District", abbreviation="OD", parent=other_root, max_depth=5
+        )
+
+        with self.assertRaises(ValidationError):
+            self.organization.move_subtree(middle)
+
+        self.organization.refresh_from_db()
+        unit.refresh_from_db()
+        self.assertEqual(self.organization.parent, self.parent_org)
+        self.assertEqual(unit.depth, 2)
+
+    def test_rejected_move_restores_the_instance(self):
+        Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=2
+        )
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        middle = Organization.objects.create(
+            name="Other District", abbreviation="OD", parent=other_root, max_depth=5
+        )
+        position = (self.organization.path, self.organization.depth)
+
+        with self.assertRaises(ValidationError):
+            self.organization.move_subtree(middle)
+
+        self.assertEqual(self.organization.parent, self.parent_org)
+        self.assertEqual((self.organization.path, self.organization.depth), position)
+
+    def test_partial_save_without_parent_does_not_move(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        organization = Organization.objects.get(pk=self.organization.pk)
+        organization.parent = other_root
+        organization.description = "Edited"
+        organization.save(update_fields=["description"])
+
+        stored = Organization.objects.get(pk=organization.pk)
+        unit.refresh_from_db()
+        self.assertEqual(stored.parent_id, self.parent_org.pk)
+        self.assertEqual(stored.path, f"{self.parent_org.pk}/")
+        self.assertEqual(unit.path, f"{self.parent_org.pk}/{organization.pk}/")
+        self.assertEqual(
+            list(Organization.objects.ancestors_of(unit).order_by("depth")),
+            [self.parent_org, stored, unit],
+        )
+
+        # A full save still performs the move.
+        organization.save()
+        unit.refresh_from_db()
+        self.assertEqual(unit.path, f"{other_root.pk}/{organization.pk}/")
+
     def test_labels_are_created_with_defaults(self):
         org = Organization.objects.create(
             name="Timber Council",
@@ -36,6 +308,714 @@ class OrganizationModelTests(BaseDomainTestCase):
         self.assertTrue(hasattr(org, "labels"))
         self.assertEqual(org.labels.attendee_label, "Attendee")
 
+    def test_bulk_create_maintains_hierarchy_and_labels(self):
+        district = Organization(
+            name="Bulk District", parent=self.organization, max_depth=5
+        )
+        units = [
+            Organization(name=f"Bulk Unit {index}", parent=district, max_depth=5)
+            for index in range(3)
+        ]
+
+        Organization.objects.bulk_create([*units, district])
+
+        self.assertEqual(district.slug, "bulk-district")
+        self.assertEqual(district.depth, self.organization.depth + 1)
+        self.assertEqual(units[0].path, f"{district.path}{district.pk}/")
+        self.assertCountEqual(
+            Organization.objects.descendants_of(self.organization).values_list(
+                "pk", flat=True
+            ),
+            [self.organization.pk, district.pk, *(unit.pk for unit in units)],
+        )
+        labels = OrganizationLabels.objects.filter(organization__in=[district, *units])
+        self.assertEqual(labels.count(), 4)
+
+    def test_saving_organization_does_not_write_labels(self):
+        self.organization.description = "Updated"
+
+        with CaptureQueriesContext(connection) as context:
+            self.organization.save()
+
+        self.assertFalse(
+            any("organizationlabels" in query["sql"] for query in context.captured_queries)
+        )
+
+    def test_loaddata_positions_fixture_organizations(self):
+        rows = [
+            {"slug": "fixture-council", "name": "Fixture Council", "parent": None},
+            {"slug": "fixture-district", "name": "Fixture District", "parent": 9001},
+            {"slug": "fixture-unit", "name": "Fixture Unit", "parent": 9002},
+        ]
+        stamp = "2026-01-01T00:00:00Z"
+        fixture = [
+            {
+                "model": "organization.organization",
+                "pk": pk,
+                "fields": {**fields, "created_at": stamp, "updated_at": stamp},
+            }
+            for pk, fields in enumerate(rows, start=9001)
+        ]
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as file:
+            json.dump(fixture, file)
+        self.addCleanup(os.remove, file.name)
+
+        call_command("loaddata", file.name, verbosity=0)
+
+        unit = Organization.objects.get(pk=9003)
+        self.assertEqual((unit.path, unit.depth), ("9001/9002/", 2))
+        self.assertEqual(unit.get_root_organization().pk, 9001)
+
+    def test_rebuild_hierarchy_command_repairs_positions(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+        Organization.objects.filter(pk=unit.pk).update(path="", depth=0)
+        unit.ancestor_links.all().delete()
+        out = StringIO()
+
+        call_command("rebuild_hierarchy", stdout=out)
+
+        unit.refresh_from_db()
+        self.assertEqual(
+            (unit.path, unit.depth),
+            (f"{self.parent_org.pk}/{self.organization.pk}/", 2),
+        )
+        self.assertCountEqual(
+            Organization.objects.ancestors_of(unit, include_self=False),
+            [self.parent_org, self.organization],
+        )
+        self.assertIn("Repositioned 1 organizations", out.getvalue())
+
+
+class OrganizationRollupTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+
+    def _create_related(self, relation, organization):
+        related = Organization._meta.get_field(relation).related_model
+        return related.objects.create(
+            name=f"Rollup {relation}", organization=organization
+        )
+
+    def _counts(self, organization, relation):
+        organization.refresh_from_db()
+        return (
+            getattr(organization, f"{relation}_count"),
+            getattr(organization, f"subtree_{relation}_count"),
+        )
+
+    def test_counters_follow_created_moved_and_deleted_rows(self):
+        for relation in ROLLUP_RELATIONS:
+            with self.subTest(relation=relation):
+                row = self._create_related(relation, self.unit)
+                self.assertEqual(self._counts(self.unit, relation), (1, 1))
+                self.assertEqual(self._counts(self.organization, relation), (0, 1))
+                self.assertEqual(self._counts(self.parent_org, relation), (0, 1))
+
+                row.organization = self.organization
+                row.save()
+                self.assertEqual(self._counts(self.unit, relation), (0, 0))
+                self.assertEqual(self._counts(self.organization, relation), (1, 1))
+                self.assertEqual(self._counts(self.parent_org, relation), (0, 1))
+
+                row.delete()
+                self.assertEqual(self._counts(self.organization, relation), (0, 0))
+                self.assertEqual(self._counts(self.parent_org, relation), (0, 0))
+
+    def test_deleting_rows_created_without_signals_keeps_counters_at_zero(self):
+        for relation in ROLLUP_RELATIONS:
+            with self.subTest(relation=relation):
+                related = Organization._meta.get_field(relation).related_model
+                (row,) = related.objects.bulk_create(
+                    [related(name=f"Bulk {relation}", organization=self.unit)]
+                )
+                self.assertEqual(self._counts(self.unit, relation), (0, 0))
+
+                row.delete()
+                self.assertEqual(self._counts(self.unit, relation), (0, 0))
+                self.assertEqual(self._counts(self.parent_org, relation), (0, 0))
+
+    def test_saves_that_do_not_write_the_organization_keep_counters(self):
+        faction = self._create_related("factions", self.unit)
+        factions = type(faction).objects
+
+        partial = factions.only("name").get(pk=faction.pk)
+        partial.name = "Renamed"
+        partial.save()
+        self.assertEqual(self._counts(self.unit, "factions"), (1, 1))
+
+        deferred = factions.defer("organization").get(pk=faction.pk)
+        self.assertEqual(deferred.organization_id, self.unit.pk)
+        deferred.save()
+        self.assertEqual(self._counts(self.unit, "factions"), (1, 1))
+
+        faction.organization = self.organization
+        faction.save(update_fields=["name"])
+        self.assertEqual(self._counts(self.unit, "factions"), (1, 1))
+
+        faction.save()
+        self.assertEqual(self._counts(self.unit, "factions"), (0, 0))
+        self.assertEqual(self._counts(self.organization, "factions"), (1, 1))
+
+    def test_reparenting_moves_subtree_totals(self):
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        self._create_related("factions", self.unit)
+        self._create_related("factions", self.organization)
+
+        self.organization.move_subtree(other_root)
+
+        self.assertEqual(self._counts(self.parent_org, "factions"), (0, 0))
+        self.assertEqual(self._counts(other_root, "factions"), (0, 2))
+        self.assertEqual(self._counts(self.organization, "factions"), (1, 2))
+
+    def test_deleting_a_subtree_updates_ancestor_totals(self):
+        self._create_related("factions", self.unit)
+        self._create_related("factions", self.organization)
+        self._create_related("factions", self.parent_org)
+
+        self.organization.delete()
+
+        self.assertEqual(self._counts(self.parent_org, "factions"), (1, 1))
+
+    def test_recompute_command_resolves_slug_paths(self):
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        Organization.objects.create(
+            name="Other Unit", slug=self.unit.slug, parent=other_root, max_depth=5
+        )
+
+        with self.assertRaisesMessage(CommandError, "ambiguous"):
+            call_command("recompute_rollups", organization=self.unit.slug)
+
+        out = StringIO()
+        path = f"{self.parent_org.slug}/{self.organization.slug}/{self.unit.slug}"
+        call_command("recompute_rollups", organization=path, stdout=out)
+        self.assertIn("Recomputed rollups for 1 organizations.", out.getvalue())
+
+    def test_failed_delete_does_not_suppress_later_adjustments(self):
+        faction = self._create_related("factions", self.unit)
+
+        def refuse(sender, instance, **kwargs):
+            raise RuntimeError("delete refused")
+
+        pre_delete.connect(refuse, sender=Organization)
+        try:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.unit.delete()
+        finally:
+            pre_delete.disconnect(refuse, sender=Organization)
+
+        faction.delete()
+        self.assertEqual(self._counts(self.unit, "factions"), (0, 0))
+        self.assertEqual(self._counts(self.parent_org, "factions"), (0, 0))
+
+
+class OrganizationImportTests(BaseDomainTestCase):
+    def _import(self, text):
+        return import_organizations(read_rows(StringIO(text)))
+
+    def test_import_resolves_parents_in_any_order(self):
+        created = self._import(
+            "name,slug,parent,max_depth\n"
+            "Import Unit,import-unit,import-district,10\n"
+            f"Import District,import-district,{self.parent_org.slug},10\n"
+        )
+
+        self.assertEqual(created, 2)
+        unit = Organization.objects.get(slug="import-unit")
+        self.assertEqual(unit.parent.slug, "import-district")
+        self.assertEqual(unit.parent.parent_id, self.parent_org.pk)
+        self.assertEqual(unit.depth, self.parent_org.depth + 2)
+        self.assertTrue(OrganizationLabels.objects.filter(organization=unit).exists())
+
+    def test_import_rejects_invalid_rows_atomically(self):
+        with self.assertRaisesMessage(ValidationError, "Maximum hierarchy depth"):
+            self._import(
+                "name,parent,max_depth\n"
+                "Import Council,,5\n"
+                "Import Troop,import-council,0\n"
+            )
+        with self.assertRaisesMessage(ValidationError, "does not exist"):
+            self._import("name,parent,max_depth\nImport Orphan,missing,5\n")
+
+        self.assertFalse(Organization.objects.filter(slug="import-council").exists())
+
+    def test_import_rejects_duplicate_names_with_line_numbers(self):
+        with self.assertRaisesMessage(ValidationError, "Line 3: name"):
+            self._import(
+                "name,slug,max_depth\n"
+                "Import Council,first,5\n"
+                "Import Council,second,5\n"
+            )
+        with self.assertRaisesMessage(ValidationError, "Line 2: name"):
+            self._import(f"name,slug,max_depth\n{self.parent_org.name},other,5\n")
+
+    def test_import_validates_fields_with_line_numbers(self):
+        long_name = "N" * 101
+        with self.assertRaisesMessage(ValidationError, "Line 2: name:"):
+            self._import(f"name,max_depth\n{long_name},5\n")
+        with self.assertRaisesMessage(ValidationError, "Line 3: abbreviation:"):
+            self._import(
+                "name,abbreviation,max_depth\n"
+                "Import Council,IC,5\n"
+                f"Import District,{'A' * 26},5\n"
+            )
+        with self.assertRaisesMessage(ValidationError, "Line 2: slug:"):
+            self._import("name,slug,max_depth\nImport Council,not a slug!,5\n")
+        self.assertFalse(Organization.objects.filter(name="Import Council").exists())
+
+    def test_import_command_reports_throughput(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as file:
+            file.write('{"name": "Import Council", "max_depth": 3}\n')
+        self.addCleanup(os.remove, file.name)
+        out = StringIO()
+
+        call_command("import_organizations", file.name, stdout=out)
+
+        self.assertIn("Imported 1 organizations", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
+
+
+class OrganizationExportTests(BaseDomainTestCase):
+    def test_export_command_streams_subtree_in_hierarchy_order(self):
+        self.parent_org.labels.update_labels(attendee_label="Scout")
+        unit = Organization.objects.create(
+            name="Export Unit", parent=self.organization, max_depth=5
+        )
+        out = StringIO()
+
+        call_command(
+            "export_organizations",
+            organization=self.organization.slug,
+            format="jsonl",
+            stdout=out,
+        )
+
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [self.organization.pk, unit.pk])
+        self.assertEqual(rows[1]["parent"], self.organization.slug)
+        self.assertEqual(rows[1]["attendee_label"], "Scout")
+
+    def test_export_command_rejects_ambiguous_slugs(self):
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        other = Organization.objects.create(
+            name="Other District",
+            slug=self.organization.slug,
+            parent=other_root,
+            max_depth=5,
+        )
+
+        with self.assertRaisesMessage(CommandError, "ambiguous"):
+            call_command("export_organizations", organization=self.organization.slug)
+
+        out = StringIO()
+        call_command(
+            "export_organizations",
+            organization=f"{other_root.slug}/{other.slug}",
+            format="jsonl",
+            stdout=out,
+        )
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["id"] for row in rows], [other.pk])
+
+    def test_export_view_streams_csv(self):
+        self.client.force_login(self._create_superuser())
+
+        response = self.client.get(reverse("organization_export"))
+
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertTrue(lines[0].startswith("id,name,slug,parent"))
+        self.assertEqual(len(lines), Organization.objects.count() + 1)
+
+
+class OrganizationViewSetTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.factory = APIRequestFactory()
+        self.user = self._create_superuser()
+
+    def _list(self, query=""):
+        request = self.factory.get(f"/api/organizations/{query}")
+        force_authenticate(request, user=self.user)
+        return OrganizationViewSet.as_view({"get": "list"})(request)
+
+    def test_list_returns_requested_fields_with_cursor(self):
+        response = self._list("?fields=id,name&page_size=1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"id", "name"})
+        self.assertIsNotNone(response.data["next"])
+
+    def test_list_joins_parent_only_when_requested(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self._list("?fields=id,parent_slug")
+
+        self.assertEqual(response.status_code, 200)
+        # One aggregate for the validators, one for the page.
+        self.assertEqual(len(context.captured_queries), 2)
+        slugs = {row["id"]: row["parent_slug"] for row in response.data["results"]}
+        self.assertEqual(slugs[self.organization.pk], self.parent_org.slug)
+        self.assertNotIn("JOIN", self._list_sql("?fields=id,name"))
+
+    def test_list_and_retrieve_answer_not_modified(self):
+        etag = self._list()["ETag"]
+        request = self.factory.get("/api/organizations/", HTTP_IF_NONE_MATCH=etag)
+        force_authenticate(request, user=self.user)
+        response = OrganizationViewSet.as_view({"get": "list"})(request)
+        self.assertEqual(response.status_code, 304)
+
+        retrieve = OrganizationViewSet.as_view({"get": "retrieve"})
+        request = self.factory.get(f"/api/organizations/{self.organization.pk}/")
+        force_authenticate(request, user=self.user)
+        etag = retrieve(request, pk=self.organization.pk)["ETag"]
+
+        self.organization.description = "Changed"
+        self.organization.save()
+        request = self.factory.get(
+            f"/api/organizations/{self.organization.pk}/", HTTP_IF_NONE_MATCH=etag
+        )
+        force_authenticate(request, user=self.user)
+        self.assertEqual(retrieve(request, pk=self.organization.pk).status_code, 200)
+
+    def _action(self, name, organization, query=""):
+        url = f"/api/organizations/{organization.pk}/{name}/{query}"
+        request = self.factory.get(url)
+        force_authenticate(request, user=self.user)
+        view = OrganizationViewSet.as_view({"get": name})
+        return view(request, pk=organization.pk)
+
+    def test_tree_nests_subtree_in_one_query(self):
+        unit = Organization.objects.create(
+            name="Tree Unit", parent=self.organization, max_depth=5
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            response = self._action("tree", self.parent_org, "?fields=id,name")
+
+        self.assertEqual(len(context.captured_queries), 2)
+        district = response.data["children"][0]
+        self.assertEqual(district["id"], self.organization.pk)
+        self.assertEqual(district["children"][0]["id"], unit.pk)
+
+        response = self._action("tree", self.parent_org, "?depth=1")
+        self.assertEqual(response.data["children"][0]["children"], [])
+
+    def test_descendants_and_ancestors_are_flat(self):
+        unit = Organization.objects.create(
+            name="Flat Unit", parent=self.organization, max_depth=5
+        )
+
+        descendants = self._action("descendants", self.parent_org).data
+        self.assertEqual(
+            [row["id"] for row in descendants], [self.organization.pk, unit.pk]
+        )
+        self.assertEqual(descendants[1]["parent"], self.organization.pk)
+
+        ancestors = self._action("ancestors", unit, "?depth=1").data
+        self.assertEqual([row["id"] for row in ancestors], [self.organization.pk])
+        self.assertEqual(self._action("ancestors", unit, "?depth=x").status_code, 400)
+
+    def _list_sql(self, query):
+        with CaptureQueriesContext(connection) as context:
+            self._list(query)
+        return context.captured_queries[-1]["sql"]
+
+
+class OrganizationTreeTests(BaseDomainTestCase):
+    def test_snapshot_answers_without_queries(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+        tree.get_tree()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(tree.root_of(unit.pk), self.parent_org.pk)
+            self.assertEqual(
+                tree.ancestors(unit.pk), [self.organization.pk, self.parent_org.pk]
+            )
+            self.assertEqual(
+                tree.descendants(self.parent_org.pk), [self.organization.pk, unit.pk]
+            )
+
+    def test_snapshot_is_invalidated_on_save(self):
+        snapshot = tree.get_tree()
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+
+        self.assertIsNot(tree.get_tree(), snapshot)
+        self.assertEqual(tree.root_of(other_root.pk), other_root.pk)
+
+    def test_uncommitted_snapshots_are_not_shared(self):
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            phantom = Organization.objects.create(
+                name="Phantom Council", abbreviation="PH", max_depth=5
+            )
+            private = tree.get_tree()
+            self.assertIn(phantom.pk, private)
+            raise RuntimeError("rolled back")
+
+        self.assertIsNot(tree._snapshot, private)
+        self.assertNotIn(phantom.pk, tree.get_tree())
+        self.assertEqual(autocomplete.autocomplete("phantom"), [])
+
+    def test_slugs_and_paths_resolve_without_queries(self):
+        other_root = Organization.objects.create(
+            name="Other Council", abbreviation="OC", max_depth=5
+        )
+        Organization.objects.create(
+            name="Other District",
+            slug=self.organization.slug,
+            abbreviation="OD",
+            parent=other_root,
+            max_depth=5,
+        )
+        path = f"{self.parent_org.slug}/{self.organization.slug}"
+        tree.get_tree()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(tree.resolve_path(path), self.organization.pk)
+            self.assertEqual(
+                tree.resolve_slug(self.parent_org.slug), self.parent_org.pk
+            )
+            # The shared slug is ambiguous without its parent.
+            self.assertIsNone(tree.resolve_slug(self.organization.slug))
+            self.assertIsNone(tree.resolve_path(f"{other_root.slug}/missing"))
+
+    def test_slug_lookups_are_memoized_per_request(self):
+        request = RequestFactory().get("/")
+        tree.get_tree()
+
+        with self.assertNumQueries(1):
+            first = get_organization_by_slug(self.parent_org.slug, request=request)
+            again = get_organization_by_slug(self.parent_org.slug, request=request)
+        self.assertIs(first, again)
+
+    def test_path_route_resolves_organization(self):
+        self.client.force_login(self._create_superuser())
+        url = reverse(
+            "organization_show_by_path",
+            kwargs={
+                "organization_path": f"{self.parent_org.slug}/{self.organization.slug}"
+            },
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["organization"], self.organization)
+
+        missing = self.client.get(url.replace(self.parent_org.slug, "missing", 1))
+        self.assertEqual(missing.status_code, 404)
+
+    def test_single_segment_path_only_matches_roots(self):
+        self.client.force_login(self._create_superuser())
+        Organization.objects.create(
+            name="Nested Namesake",
+            slug=self.parent_org.slug,
+            parent=self.organization,
+            max_depth=5,
+        )
+
+        def show_by_path(path):
+            url = reverse(
+                "organization_show_by_path", kwargs={"organization_path": path}
+            )
+            return self.client.get(url)
+
+        response = show_by_path(self.parent_org.slug)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["organization"], self.parent_org)
+        self.assertEqual(show_by_path(self.organization.slug).status_code, 404)
+
+
+@override_settings(ORGANIZATION_SEARCH_BACKEND="terms")
+class OrganizationSearchTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        self.council = Organization.objects.create(
+            name="Great Lakes Council", abbreviation="GLC", max_depth=5
+        )
+        self.lakeside = Organization.objects.create(
+            name="Lakeside District", parent=self.council, max_depth=5
+        )
+        self.harbor = Organization.objects.create(
+            name="Harbor Unit",
+            description="Sails on the lake every summer.",
+            parent=self.lakeside,
+            max_depth=5,
+        )
+
+    def test_search_ranks_prefix_matches_across_fields(self):
+        results = list(Organization.objects.search("lake"))
+
+        # Name prefixes beat description words; ties are ordered by name.
+        self.assertEqual(results, [self.council, self.lakeside, self.harbor])
+        self.assertEqual(
+            list(Organization.objects.search("lakeside"))[0], self.lakeside
+        )
+        self.assertEqual(list(Organization.objects.search("GREAT la")), [self.council])
+        self.assertEqual(list(Organization.objects.search("glc")), [self.council])
+        self.assertEqual(list(Organization.objects.search("lake pond")), [])
+        self.assertEqual(
+            list(Organization.objects.search_by_name("harb")), [self.harbor]
+        )
+
+    def test_search_can_be_scoped_to_a_subtree(self):
+        results = Organization.objects.search("lake", within=self.lakeside)
+
+        self.assertEqual(list(results), [self.lakeside, self.harbor])
+
+    @override_settings(ORGANIZATION_HIERARCHY_INDEX=False)
+    def test_scoped_search_without_hierarchy_index(self):
+        marina = Organization.objects.create(
+            name="Lake Marina", parent=self.lakeside, max_depth=5
+        )
+
+        results = Organization.objects.search("lake", within=self.lakeside)
+
+        self.assertEqual(list(results), [marina, self.lakeside, self.harbor])
+
+    def test_index_follows_renames_and_bulk_inserts(self):
+        self.harbor.name = "Pier Unit"
+        self.harbor.save()
+        (dock,) = Organization.objects.bulk_create(
+            [Organization(name="Dockside Crew", parent=self.harbor, max_depth=5)]
+        )
+
+        self.assertEqual(list(Organization.objects.search("harbor")), [])
+        self.assertEqual(list(Organization.objects.search("pier")), [self.harbor])
+        self.assertEqual(list(Organization.objects.search("docks")), [dock])
+
+    def test_saving_unchanged_text_does_not_reindex(self):
+        organization = Organization.objects.get(pk=self.harbor.pk)
+        organization.is_active = False
+
+        with CaptureQueriesContext(connection) as context:
+            organization.save()
+        self.assertFalse(
+            any(
+                "organizationsearchterm" in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "organization-label-tests",
+        }
+    }
+)
+class OrganizationLabelCacheTests(BaseDomainTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_labels_are_cached_per_root_organization(self):
+        labels = label_service.get_labels(self.parent_org.pk)
+        self.assertEqual(labels["attendee_label"], "Attendee")
+        self.assertEqual(labels["attendee_label_plural"], "Attendees")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(label_service.get_labels(self.parent_org.pk), labels)
+
+    def test_saving_labels_invalidates_cache(self):
+        label_service.get_labels(self.parent_org.pk)
+
+        self.parent_org.labels.update_labels(attendee_label="Scout")
+
+        labels = label_service.get_labels(self.parent_org.pk)
+        self.assertEqual(labels["attendee_label"], "Scout")
+        self.assertEqual(labels["attendee_label_plural"], "Scouts")
+
+    def test_labels_merge_overrides_down_the_ancestor_chain(self):
+        self.parent_org.labels.update_labels(attendee_label="Scout")
+        self.organization.labels.update_labels(leader_label="Guide", week_label="Week")
+        self.assertEqual(self.organization.labels.overrides, {"leader_label": "Guide"})
+
+        labels = label_service.get_labels(self.organization.pk)
+        self.assertEqual(labels["attendee_label"], "Scout")
+        self.assertEqual(labels["leader_label_plural"], "Guides")
+
+        self.parent_org.labels.update_labels(attendee_label="Camper")
+        labels = label_service.get_labels(self.organization.pk)
+        self.assertEqual(labels["attendee_label"], "Camper")
+
+    def test_organizations_inheriting_labels_share_one_bundle(self):
+        self.parent_org.labels.update_labels(attendee_label="Scout")
+        labels = label_service.get_labels(self.parent_org.pk)
+
+        with self.assertNumQueries(0):
+            self.assertIs(label_service.get_labels(self.organization.pk), labels)
+
+        self.organization.labels.update_labels(attendee_label="Cub")
+        self.assertEqual(
+            label_service.get_labels(self.organization.pk)["attendee_label"], "Cub"
+        )
+        self.assertEqual(
+            label_service.get_labels(self.parent_org.pk)["attendee_label"], "Scout"
+        )
+
+    def test_context_processor_resolves_labels_lazily(self):
+        request = RequestFactory().get("/")
+        request.user = self._create_superuser()
+
+        with self.assertNumQueries(0):
+            context = organization_labels(request)
+        self.assertIs(
+            organization_labels(request)["organization_labels"],
+            context["organization_labels"],
+        )
+
+        labels = context["organization_labels"]
+        self.assertEqual(labels["attendee_label"], "Attendee")
+        with self.assertNumQueries(0):
+            self.assertEqual(labels["leader_label_plural"], "Leaders")
+
+    def test_label_entry_points_share_one_resolution(self):
+        user = self._create_superuser()
+        request = RequestFactory().get("/")
+        request.user = user
+
+        with self.assertNumQueries(1):
+            labels = fetch_labels(request)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_organization_labels(user), labels)
+
+    def test_for_organizations_resolves_root_labels_in_two_queries(self):
+        self.parent_org.labels.update_labels(attendee_label="Scout")
+        organizations = [self.parent_org, self.organization]
+
+        with self.assertNumQueries(2):
+            labels = OrganizationLabels.objects.for_organizations(
+                [org.pk for org in organizations]
+            )
+
+        for organization in organizations:
+            self.assertEqual(labels[organization.pk]["attendee_label"], "Scout")
+            self.assertEqual(labels[organization.pk]["leader_label"], "Leader")
+
+    def test_saving_labels_warms_plural_cache(self):
+        self.parent_org.labels.update_labels(leader_label="Guide")
+        hits = label_service.pluralize.cache_info().hits
+
+        labels = label_service.build_labels(self.parent_org.pk)
+
+        self.assertEqual(labels["leader_label_plural"], "Guides")
+        self.assertGreater(label_service.pluralize.cache_info().hits, hits)
+
 
 class OrganizationFormTests(BaseDomainTestCase):
     def test_duplicate_name_in_same_parent_invalid(self):
@@ -51,6 +1031,119 @@ class OrganizationFormTests(BaseDomainTestCase):
         )
         self.assertFalse(form.is_valid())
 
+    def test_parent_widget_renders_only_the_selected_organization(self):
+        for index in range(5):
+            Organization.objects.create(
+                name=f"Spare Unit {index}", parent=self.parent_org, max_depth=5
+            )
+        form = OrganizationForm(instance=self.organization)
+
+        html = form["parent"].as_widget()
+        self.assertIn(
+            f'data-autocomplete-url="{reverse("organization_autocomplete")}"', html
+        )
+        self.assertIn(f'<option value="{self.parent_org.pk}" selected>', html)
+        self.assertNotIn("Spare Unit", html)
+        self.assertNotIn("<script", html)
+        self.assertEqual(str(form.media).count("organization/js/autocomplete.js"), 1)
+
+    def test_labels_form_overrides_inherited_labels(self):
+        self.parent_org.labels.update_labels(attendee_label="Scout")
+        labels = self.organization.labels
+
+        form = OrganizationLabelsForm(instance=labels)
+        self.assertEqual(form["attendee_label"].initial, "Scout")
+        self.assertIn('placeholder="Scout"', form["attendee_label"].as_widget())
+
+        data = {"attendee_label": "Attendee", "leader_label": "Leader"}
+        form = OrganizationLabelsForm(data=data, instance=labels)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        labels.refresh_from_db()
+        self.assertEqual(labels.overrides, {"attendee_label": "Attendee"})
+        self.assertEqual(
+            label_service.get_labels(self.organization.pk)["attendee_label"],
+            "Attendee",
+        )
+
+        form = OrganizationLabelsForm(data={"attendee_label": "Scout"}, instance=labels)
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+        labels.refresh_from_db()
+        self.assertEqual(labels.overrides, {})
+
+
+    def test_create_page_includes_the_autocomplete_script(self):
+        self.client.force_login(self._create_superuser())
+
+        response = self.client.get(reverse("organization_new"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(
+            response, 'organization/js/autocomplete.js"></script>', count=1
+        )
+
+
+class OrganizationAutocompleteTests(BaseDomainTestCase):
+    def test_autocomplete_returns_paths_from_memory(self):
+        unit = Organization.objects.create(
+            name="Cedar Unit", abbreviation="CU", parent=self.organization, max_depth=5
+        )
+        request = RequestFactory().get("/", {"q": "ced un"})
+        request.user = self._create_superuser()
+        autocomplete.get_index()
+
+        with self.assertNumQueries(0):
+            response = AutocompleteView.as_view()(request)
+        results = json.loads(response.content)["results"]
+        self.assertEqual([result["id"] for result in results], [unit.pk])
+        self.assertEqual(
+            results[0]["path"],
+            " › ".join([self.parent_org.name, self.organization.name, unit.name]),
+        )
+
+    def test_index_is_rebuilt_when_the_tree_changes(self):
+        self.assertEqual(autocomplete.autocomplete("willow"), [])
+        self.organization.name = "Willow District"
+        self.organization.save()
+
+        (result,) = autocomplete.autocomplete("wil")
+        self.assertEqual(result["id"], self.organization.pk)
+        self.assertEqual(autocomplete.autocomplete("cu", limit=0), [])
+
+
+class OrganizationDetailViewTests(BaseDomainTestCase):
+    def test_detail_view_answers_not_modified(self):
+        self.client.force_login(self._create_superuser())
+        url = reverse(
+            "organization_show", kwargs={"organization_id": self.organization.pk}
+        )
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+    def test_detail_view_renders_from_one_query(self):
+        request = RequestFactory().get("/")
+        request.user = self._create_superuser()
+        view = DetailView.as_view()
+        tree.get_tree()
+
+        for counters in (True, False):
+            with self.settings(ORGANIZATION_ROLLUP_COUNTERS=counters):
+                with CaptureQueriesContext(connection) as context:
+                    response = view(request, organization_slug=self.organization.slug)
+                    response.render()
+            organization_queries = [
+                query
+                for query in context.captured_queries
+                if "organization_organization" in query["sql"]
+            ]
+            self.assertEqual(len(organization_queries), 1)
+            self.assertEqual(response.context_data["summary"]["factions"]["direct"], 0)
+
 
 class OrganizationListViewTests(BaseDomainTestCase):
     def setUp(self):
@@ -62,3 +1155,42 @@ class OrganizationListViewTests(BaseDomainTestCase):
         request.user = self._create_superuser()
         response = ListView.as_view()(request)
         self.assertEqual(response.status_code, 200)
+
+    def _render_queries(self, user, query=""):
+        request = self.factory.get(f"/organizations/{query}")
+        request.user = user
+        with CaptureQueriesContext(connection) as context:
+            response = ListView.as_view()(request)
+            response.render()
+        return len(context.captured_queries), response
+
+    def test_query_count_does_not_grow_with_rows(self):
+        user = self._create_superuser()
+        small, _ = self._render_queries(user)
+        Organization.objects.bulk_create(
+            Organization(
+                name=f"Listed Unit {index}", parent=self.organization, max_depth=5
+            )
+            for index in range(30)
+        )
+
+        large, _ = self._render_queries(user)
+
+        self.assertEqual(large, small)
+
+    def test_list_pages_by_keyset(self):
+        Organization.objects.bulk_create(
+            Organization(name=f"Paged Unit {index:02}", max_depth=5)
+            for index in range(ListView.keyset_page_size + 5)
+        )
+        user = self._create_superuser()
+
+        _, first = self._render_queries(user)
+        next_url = first.context_data["next_page_url"]
+        _, second = self._render_queries(user, next_url)
+
+        first_names = [row.record.name for row in first.context_data["table"].rows]
+        second_names = [row.record.name for row in second.context_data["table"].rows]
+        self.assertEqual(len(first_names), ListView.keyset_page_size)
+        self.assertLess(first_names[-1], second_names[0])
+        self.assertIsNone(second.context_data["next_page_url"])
@@ -1,21 +1,27 @@
 """ Organization URLs. """
 
 from rest_framework.routers import DefaultRouter
-from django.urls import path, include
+from django.urls import path, include, register_converter
+
+from .converters import OrganizationPathConverter
 
 from .views.organization import (
+    AutocompleteView,
     ListView,
     RootListView,
     CreateView,
     DetailView,
+    ExportView,
     ListByParentView,
     SubOrganizationCreateView,
     OrganizationViewSet,
     UpdateView,
 )
 
+register_converter(OrganizationPathConverter, "orgpath")
+
 router = DefaultRouter()
-router.register(r"organizations", OrganizationViewSet)
+router.register(r"organizations", OrganizationViewSet, basename="organization")
 
 urlpatterns = [
     #############################
@@ -38,6 +44,12 @@ urlpatterns = [
         ListByParentView.as_view(),
         name="organization_index_by_parent",
     ),
+    # Autocomplete
+    path(
+        "organizations/autocomplete/",
+        AutocompleteView.as_view(),
+        name="organization_autocomplete",
+    ),
     # New
     path("organizations/new/", CreateView.as_view(), name="organization_new"),
     path(
@@ -45,7 +57,23 @@ urlpatterns = [
         SubOrganizationCreateView.as_view(),
         name="sub_organization_create",
     ),
+    # Export
+    path(
+        "organizations/export/",
+        ExportView.as_view(),
+        name="organization_export",
+    ),
+    path(
+        "organizations/<slug:organization_slug>/export/",
+        ExportView.as_view(),
+        name="organization_export",
+    ),
     # Show
+    path(
+        "organizations/by-path/<orgpath:organization_path>/",
+        DetailView.as_view(),
+        name="organization_show_by_path",
+    ),
     path(
         "organizations/<int:organization_id>/",
         DetailView.as_view(),
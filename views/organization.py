@@ -1,6 +1,18 @@
 # organization/views/organization.py
 
+from django.db.models import Count, Max
+from django.http import (
+    Http404,
+    HttpResponseBadRequest,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.urls import reverse_lazy
+from django.views import View
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError as APIValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
 
 from core.views.base import (
     BaseTableListView,
@@ -17,18 +29,32 @@ from core.mixins.models import SoftDeleteMixin
 
 from ..models.organization import Organization
 from ..forms.organization import OrganizationForm
-from ..serializers import OrganizationSerializer
+from ..conditional import not_modified, organization_validators, set_validators
+from ..pagination import KeysetTablePaginationMixin, OrganizationCursorPagination
+from ..serializers import FIELD_SOURCES, OrganizationSerializer, requested_fields
+from ..services.autocomplete import (
+    AUTOCOMPLETE_LIMIT,
+    AUTOCOMPLETE_MAX_LIMIT,
+    autocomplete,
+)
+from ..services.exporter import EXPORT_FORMATS, export_queryset, export_rows
+from ..services.labels import get_user_labels
 from ..tables.organization import OrganizationTable
 from ..selectors import (
     get_organization_by_slug,
+    organization_detail_queryset,
     organization_queryset,
+    organization_summary,
+    organization_table_queryset,
+    resolve_organization_id,
+    resolve_organization_path,
     root_organizations_queryset,
 )
 from core.api import BaseModelViewSet
 from core.permissions import IsAuthenticatedAndActive
 
 
-class ListView(LoginRequiredMixin, BaseTableListView):
+class ListView(LoginRequiredMixin, KeysetTablePaginationMixin, BaseTableListView):
     """
     Table-based list of all organizations.
     Adds can_edit / can_delete flags to the context based on user perms.
@@ -40,7 +66,7 @@ class ListView(LoginRequiredMixin, BaseTableListView):
     context_object_name = "organizations"
 
     def get_queryset(self):
-        return organization_queryset()
+        return organization_table_queryset()
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -75,9 +101,60 @@ class DetailView(LoginRequiredMixin, BaseSlugOrPkObjectMixin, BaseDetailView):
     context_object_name = "organization"
     object_pk_kwarg = "organization_id"
     object_slug_kwarg = "organization_slug"
+    object_path_kwarg = "organization_path"
+
+    def get_queryset(self):
+        return organization_detail_queryset()
+
+    def get_object(self, queryset=None):
+        """
+        Resolves the organization by pk, slug or slug path in a single query;
+        slugs and paths are mapped to ids through the tree snapshot. Slugs are
+        only unique per parent, so an ambiguous slug is a 404.
+        """
+
+        if queryset is None:
+            queryset = self.get_queryset()
+        if self.object_pk_kwarg in self.kwargs:
+            pk = self.kwargs[self.object_pk_kwarg]
+        elif self.object_path_kwarg in self.kwargs:
+            pk = resolve_organization_path(self.kwargs[self.object_path_kwarg])
+        else:
+            pk = resolve_organization_id(self.kwargs.get(self.object_slug_kwarg, ""))
+        organization = queryset.filter(pk=pk).first() if pk is not None else None
+        if organization is None:
+            raise Http404("No organization matches the given query.")
+        return organization
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["summary"] = organization_summary(self.object)
+        return context
+
+    def get(self, request, *args, **kwargs):
+        """
+        Renders the page, or answers 304 when the client's cached copy is
+        still current; the validators are computed before any rendering.
+        """
+
+        self.object = self.get_object()
+        etag, last_modified = organization_validators(
+            request,
+            self.object.updated_at,
+            self.object.pk,
+            request.user.pk,
+            sorted(get_user_labels(request.user).items()),
+        )
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            context = self.get_context_data(object=self.object)
+            response = self.render_to_response(context)
+        return set_validators(response, etag, last_modified)
 
 
-class ListByParentView(LoginRequiredMixin, BaseIndexByFilterTableView):
+class ListByParentView(
+    LoginRequiredMixin, KeysetTablePaginationMixin, BaseIndexByFilterTableView
+):
     """
     List of organizations filtered by parent org (pk or slug).
     """
@@ -92,6 +169,15 @@ class ListByParentView(LoginRequiredMixin, BaseIndexByFilterTableView):
     context_object_name_for_filter = "parent_org"
     table_class = OrganizationTable
 
+    def get_filter_object(self):
+        organization_slug = self.kwargs.get("organization_slug")
+        if organization_slug:
+            return get_organization_by_slug(organization_slug, request=self.request)
+        return super().get_filter_object()
+
+    def get_queryset(self):
+        return organization_table_queryset(super().get_queryset())
+
 
 class CreateView(LoginRequiredMixin, BaseCreateView):
     """
@@ -121,7 +207,7 @@ class SubOrganizationCreateView(LoginRequiredMixin, BaseCreateView):
 
     def get_parent_organization(self):
         organization_slug = self.kwargs.get("organization_slug")
-        return get_organization_by_slug(organization_slug)
+        return get_organization_by_slug(organization_slug, request=self.request)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -176,7 +262,184 @@ class DeleteView(
     action = "Delete"
 
 
+class ExportView(LoginRequiredMixin, PermissionRequiredMixin, View):
+    """
+    Streams all organizations, or one organization's subtree (by slug), as
+    CSV or JSON Lines (``?format=jsonl``) without building the export in memory.
+    """
+
+    permission_required = "organization.view_organization"
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            return HttpResponseBadRequest(f"Unsupported export format: {export_format}")
+
+        root = None
+        filename = "organizations"
+        organization_slug = self.kwargs.get("organization_slug")
+        if organization_slug:
+            root = get_organization_by_slug(organization_slug, request=request)
+            filename = root.slug
+
+        stream, content_type = EXPORT_FORMATS[export_format]
+        response = StreamingHttpResponse(
+            stream(export_rows(export_queryset(root))), content_type=content_type
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{filename}.{export_format}"'
+        )
+        return response
+
+
+class AutocompleteView(LoginRequiredMixin, View):
+    """
+    Returns the organizations whose name or abbreviation words start with the
+    words of ``?q=``, with their paths, as JSON for organization pickers.
+    Served from the in-memory autocomplete index.
+    """
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = int(request.GET.get("limit", AUTOCOMPLETE_LIMIT))
+        except ValueError:
+            return HttpResponseBadRequest("Invalid limit.")
+        limit = max(0, min(limit, AUTOCOMPLETE_MAX_LIMIT))
+        return JsonResponse(
+            {"results": autocomplete(request.GET.get("q", ""), limit=limit)}
+        )
+
+
 class OrganizationViewSet(BaseModelViewSet):
-    queryset = organization_queryset()
     serializer_class = OrganizationSerializer
     permission_classes = [IsAuthenticatedAndActive]
+    pagination_class = OrganizationCursorPagination
+
+    def get_queryset(self):
+        """
+        Builds the queryset per request. Reads only load the columns, and join
+        only the relations, that the requested ``?fields=`` need.
+        """
+
+        queryset = organization_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        fields = set(self.get_serializer_class().Meta.fields)
+        requested = requested_fields(self.request)
+        if requested and requested & fields:
+            fields &= requested
+        # updated_at always feeds the ETag / Last-Modified validators.
+        sources = {"id", "updated_at"}
+        if self.action in ("tree", "descendants", "ancestors"):
+            sources.update(("parent", "path", "depth"))
+        for name in fields:
+            sources.update(FIELD_SOURCES.get(name, (name,)))
+        related = {source.split("__")[0] for source in sources if "__" in source}
+        if related:
+            queryset = queryset.select_related(*related)
+        return queryset.only(*sources)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lists organizations, answering 304 when nothing in the filtered set has
+        changed since the client's copy; costs one aggregate query.
+        """
+
+        queryset = self.filter_queryset(self.get_queryset())
+        stats = queryset.order_by().aggregate(
+            updated_at=Max("updated_at"), total=Count("pk")
+        )
+        etag, last_modified = organization_validators(
+            request, stats["updated_at"], stats["total"]
+        )
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                serializer = self.get_serializer(page, many=True)
+                response = self.get_paginated_response(serializer.data)
+            else:
+                response = Response(self.get_serializer(queryset, many=True).data)
+        return set_validators(response, etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Returns one organization, or 304 when it has not changed since the
+        client's copy.
+        """
+
+        instance = self.get_object()
+        etag, last_modified = organization_validators(
+            request, instance.updated_at, instance.pk
+        )
+        response = not_modified(request, etag, last_modified)
+        if response is None:
+            response = Response(self.get_serializer(instance).data)
+        return set_validators(response, etag, last_modified)
+
+    @action(detail=True)
+    def tree(self, request, pk=None):
+        """
+        Returns the organization with its subtree nested under ``children``,
+        optionally cut off ``?depth=`` levels down.
+        """
+
+        organization = self.get_object()
+        subtree = list(self._subtree(organization, include_self=True))
+        nodes = {}
+        for member, node in zip(subtree, self.get_serializer(subtree, many=True).data):
+            node["children"] = []
+            nodes[member.pk] = node
+            if member.pk != organization.pk:
+                nodes[member.parent_id]["children"].append(node)
+        return Response(nodes[organization.pk])
+
+    @action(detail=True)
+    def descendants(self, request, pk=None):
+        """
+        Returns the organizations below this one as a flat list, parents before
+        children, optionally limited to ``?depth=`` levels.
+        """
+
+        organization = self.get_object()
+        subtree = self._subtree(organization, include_self=False)
+        return Response(self.get_serializer(subtree, many=True).data)
+
+    @action(detail=True)
+    def ancestors(self, request, pk=None):
+        """
+        Returns the organizations above this one, root first, optionally only
+        the nearest ``?depth=`` levels.
+        """
+
+        organization = self.get_object()
+        ancestor_ids = [int(pk) for pk in organization.path.split("/") if pk]
+        ancestors = self.get_queryset().filter(pk__in=ancestor_ids)
+        depth = self._depth_limit()
+        if depth is not None:
+            ancestors = ancestors.filter(depth__gte=organization.depth - depth)
+        ancestors = ancestors.order_by("depth")
+        return Response(self.get_serializer(ancestors, many=True).data)
+
+    def _subtree(self, organization, include_self):
+        # One query on the indexed path prefix, parents ordered before children.
+        subtree = self.get_queryset().filter(path__startswith=organization.tree_path)
+        if include_self:
+            subtree = subtree | self.get_queryset().filter(pk=organization.pk)
+        depth = self._depth_limit()
+        if depth is not None:
+            subtree = subtree.filter(depth__lte=organization.depth + depth)
+        return subtree.order_by("depth", "name")
+
+    def _depth_limit(self):
+        depth = self.request.query_params.get("depth")
+        if depth in (None, ""):
+            return None
+        try:
+            depth = int(depth)
+        except ValueError:
+            depth = -1
+        if depth < 0:
+            raise APIValidationError({"depth": "Must be a non-negative integer."})
+        return depth